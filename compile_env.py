@@ -0,0 +1,22 @@
+'''
+Compile .env into .env.compiled.py, a Python dict literal that config.py
+prefers over re-parsing .env on startup.
+
+Usage: python -m compile_env
+
+Re-run after editing .env (config.py falls back to parsing .env whenever
+the compiled file is older).
+'''
+
+import pprint
+from dotenv import dotenv_values
+
+def main():
+    values = dict(dotenv_values('.env'))
+    with open('.env.compiled.py', 'w') as f:
+        f.write('# Generated by compile_env.py - do not edit, re-run python -m compile_env\n')
+        f.write('ENV = ' + pprint.pformat(values) + '\n')
+    print(f"Wrote {len(values)} entries to .env.compiled.py")
+
+if __name__ == '__main__':
+    main()
@@ -1,87 +1,229 @@
 import os
+from datetime import time as dt_time
 from dotenv import load_dotenv
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import cached_property
 import logging
+import threading
 
 logger = logging.getLogger(__name__)
 
-# Force reload environment variables
-load_dotenv(override=True)
+# Load .env once per process and snapshot the environment into a plain dict,
+# so Config construction does dict lookups instead of repeated os.getenv calls
+_ENV_LOADED = False
+_ENV = {}
 
-@dataclass
+_BASE_DIR = os.path.dirname(os.path.realpath(__file__))
+_ENV_FILE = os.path.join(_BASE_DIR, '.env')
+_COMPILED_ENV_FILE = os.path.join(_BASE_DIR, '.env.compiled.py')
+
+def _load_compiled_env():
+    """Load .env.compiled.py (see compile_env.py) when it is newer than .env.
+
+    Returns the compiled dict, or None when the compiled file is missing or
+    stale so the caller falls back to parsing .env.
+    """
+    if not os.path.exists(_COMPILED_ENV_FILE):
+        return None
+    try:
+        if (os.path.exists(_ENV_FILE) and
+                os.path.getmtime(_COMPILED_ENV_FILE) < os.path.getmtime(_ENV_FILE)):
+            return None
+        import importlib.util
+        spec = importlib.util.spec_from_file_location('_env_compiled', _COMPILED_ENV_FILE)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module.ENV
+    except Exception as e:
+        logger.warning("Could not load compiled env file: %s", e)
+        return None
+
+def _load_env_once():
+    global _ENV_LOADED, _ENV
+    if not _ENV_LOADED:
+        compiled = _load_compiled_env()
+        if compiled is not None:
+            # Compiled values override the process env, matching
+            # load_dotenv(override=True) behavior. Export them to
+            # os.environ too so os.getenv consumers outside config.py
+            # (e.g. runner's QUIET_MODE checks) see .env values
+            os.environ.update(
+                {k: v for k, v in compiled.items() if v is not None})
+            _ENV = dict(os.environ)
+        else:
+            load_dotenv(override=True)
+            _ENV = dict(os.environ)
+        _ENV_LOADED = True
+
+def refresh_env_cache():
+    """Re-read .env and rebuild the environment snapshot"""
+    global _ENV_LOADED
+    _ENV_LOADED = False
+    _load_env_once()
+
+_load_env_once()
+
+# Numeric env vars parsed once through a single typed table
+# (name, caster, default) - defaults are NYC coordinates
+_TYPED_FIELDS = (
+    ('WEATHER_LAT', float, '40.7128'),
+    ('WEATHER_LON', float, '-74.0060'),
+)
+
+@dataclass(frozen=True, repr=False, eq=False)
 class DisplayConfig:
     WIDTH: int = 825
     HEIGHT: int = 1200
-    
-    def __post_init__(self):
-        self.HEADER_HEIGHT = self.HEIGHT // 9 # 1/8th of the height
-        self.TRAIN_SECTION_HEIGHT =  (self.HEIGHT * 2) // 3 # ((self.HEIGHT - self.HEADER_HEIGHT) * 2) // 4  # Half the height 
-        self.WEATHER_SECTION_HEIGHT = self.HEIGHT - self.HEADER_HEIGHT - self.TRAIN_SECTION_HEIGHT # The rest
-        
-        # Add vertical lane dimensions
-        self.VERTICAL_LANE_WIDTH = self.WIDTH // 3
-        self.MAIN_SECTION_WIDTH = self.WIDTH - self.VERTICAL_LANE_WIDTH
-        
-        # Central column position for train and weather icons
-        self.ICON_COLUMN_X = 100 # self.MAIN_SECTION_WIDTH // 6
-        
-        self.HEADER_Y = 0
-        self.TRAIN_SECTION_Y = self.HEADER_HEIGHT
-        self.WEATHER_SECTION_Y = self.TRAIN_SECTION_Y + self.TRAIN_SECTION_HEIGHT
-        
-        # Add vertical lane position
-        self.VERTICAL_LANE_X = self.MAIN_SECTION_WIDTH
 
-@dataclass
+    # Central column position for train and weather icons
+    ICON_COLUMN_X: int = 100 # self.MAIN_SECTION_WIDTH // 6
+    HEADER_Y: int = 0
+
+    # Diffs smaller than this area (px) are deferred rather than refreshed
+    MIN_PARTIAL_REFRESH_AREA: int = 1024
+
+    @cached_property
+    def HEADER_HEIGHT(self):
+        return self.HEIGHT // 9 # 1/8th of the height
+
+    @cached_property
+    def TRAIN_SECTION_HEIGHT(self):
+        return (self.HEIGHT * 2) // 3 # ((self.HEIGHT - self.HEADER_HEIGHT) * 2) // 4  # Half the height
+
+    @cached_property
+    def WEATHER_SECTION_HEIGHT(self):
+        return self.HEIGHT - self.HEADER_HEIGHT - self.TRAIN_SECTION_HEIGHT # The rest
+
+    # Vertical lane dimensions
+    @cached_property
+    def VERTICAL_LANE_WIDTH(self):
+        return self.WIDTH // 3
+
+    @cached_property
+    def MAIN_SECTION_WIDTH(self):
+        return self.WIDTH - self.VERTICAL_LANE_WIDTH
+
+    @cached_property
+    def TRAIN_SECTION_Y(self):
+        return self.HEADER_HEIGHT
+
+    @cached_property
+    def WEATHER_SECTION_Y(self):
+        return self.TRAIN_SECTION_Y + self.TRAIN_SECTION_HEIGHT
+
+    # Vertical lane position
+    @cached_property
+    def VERTICAL_LANE_X(self):
+        return self.MAIN_SECTION_WIDTH
+
+@dataclass(frozen=True, repr=False, eq=False)
 class WeatherConfig:
-    def __init__(self, display: DisplayConfig):
-        # Adjust main icon sizes for new layout
-        self.MAIN_ICON_SIZE = 165
-        self.SMALL_ICON_SIZE = 80 # round(display.WEATHER_SECTION_HEIGHT / 4)
-        self.VERTICAL_ICON_SIZE = 165  # New size for vertical lane
-
-        self.CURRENT_X = 20
-        self.CURRENT_Y = display.WEATHER_SECTION_Y + 20
-        
-        # Add vertical lane positions
-        self.VERTICAL_CURRENT_Y = display.TRAIN_SECTION_Y + 20
-        self.VERTICAL_HOURLY_START_Y = self.VERTICAL_CURRENT_Y + self.VERTICAL_ICON_SIZE + 40
-        
-        self.FORECAST_Y = self.CURRENT_Y + self.MAIN_ICON_SIZE + 40
-        spacing = (display.WIDTH - 60) // 3
-        self.TODAY_X = 20
-        self.TOMORROW_X = self.TODAY_X + spacing
-        self.OVERMORROW_X = self.TOMORROW_X + spacing
+    display: DisplayConfig
+
+    # Adjust main icon sizes for new layout
+    MAIN_ICON_SIZE: int = 165
+    SMALL_ICON_SIZE: int = 80 # round(display.WEATHER_SECTION_HEIGHT / 4)
+    VERTICAL_ICON_SIZE: int = 165  # New size for vertical lane
 
-@dataclass
+    CURRENT_X: int = 20
+    TODAY_X: int = 20
+
+    @cached_property
+    def CURRENT_Y(self):
+        return self.display.WEATHER_SECTION_Y + 20
+
+    # Vertical lane positions
+    @cached_property
+    def VERTICAL_CURRENT_Y(self):
+        return self.display.TRAIN_SECTION_Y + 20
+
+    @cached_property
+    def VERTICAL_HOURLY_START_Y(self):
+        return self.VERTICAL_CURRENT_Y + self.VERTICAL_ICON_SIZE + 40
+
+    @cached_property
+    def FORECAST_Y(self):
+        return self.CURRENT_Y + self.MAIN_ICON_SIZE + 40
+
+    @cached_property
+    def _spacing(self):
+        return (self.display.WIDTH - 60) // 3
+
+    @cached_property
+    def TOMORROW_X(self):
+        return self.TODAY_X + self._spacing
+
+    @cached_property
+    def OVERMORROW_X(self):
+        return self.TOMORROW_X + self._spacing
+
+@dataclass(frozen=True, repr=False, eq=False)
 class SubwayConfig:
-    def __init__(self, display: DisplayConfig):
-        self.SECTION_Y = display.TRAIN_SECTION_Y
-        self.SECTION_HEIGHT = display.TRAIN_SECTION_HEIGHT
-        self.NEXT_TRAIN_Y = self.SECTION_Y + 20
-        self.LIST_Y = self.NEXT_TRAIN_Y + 100
-        self.PADDING_X = 20
-        
-        # Position F and G trains at 1/4 and 3/4 of the section height
-        self.F_TRAIN_Y = self.SECTION_Y + (self.SECTION_HEIGHT // 2) - (self.SECTION_HEIGHT // 4)
-        self.G_TRAIN_Y = self.SECTION_Y + (self.SECTION_HEIGHT // 2) + (self.SECTION_HEIGHT // 4)
+    display: DisplayConfig
+
+    PADDING_X: int = 20
+
+    @cached_property
+    def SECTION_Y(self):
+        return self.display.TRAIN_SECTION_Y
+
+    @cached_property
+    def SECTION_HEIGHT(self):
+        return self.display.TRAIN_SECTION_HEIGHT
 
-@dataclass
+    @cached_property
+    def NEXT_TRAIN_Y(self):
+        return self.SECTION_Y + 20
+
+    @cached_property
+    def LIST_Y(self):
+        return self.NEXT_TRAIN_Y + 100
+
+    # Position F and G trains at 1/4 and 3/4 of the section height
+    @cached_property
+    def F_TRAIN_Y(self):
+        return self.SECTION_Y + (self.SECTION_HEIGHT // 2) - (self.SECTION_HEIGHT // 4)
+
+    @cached_property
+    def G_TRAIN_Y(self):
+        return self.SECTION_Y + (self.SECTION_HEIGHT // 2) + (self.SECTION_HEIGHT // 4)
+
+@dataclass(frozen=True, repr=False, eq=False)
 class TimeConfig:
-    def __init__(self, display: DisplayConfig, FONT_SIZES):
-        self.Y = display.HEADER_Y + (display.HEADER_HEIGHT // 2) - FONT_SIZES['header'] // 2 - 8
-        self.X = display.WIDTH // 2
+    display: DisplayConfig
+    FONT_SIZES: dict
+
+    @cached_property
+    def Y(self):
+        return self.display.HEADER_Y + (self.display.HEADER_HEIGHT // 2) - self.FONT_SIZES['header'] // 2 - 8
+
+    @cached_property
+    def X(self):
+        return self.display.WIDTH // 2
 
 class Config:
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    @classmethod
+    def instance(cls):
+        """Return the shared Config, constructing it once per process"""
+        # Double-checked locking: skip the lock on the common path
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
     def __init__(self):
         # Environment variables
         logger.info("Loading configuration from environment variables...")
-        self.WEATHER_KEY = os.getenv('WEATHER_KEY')
-        self.DEBUG = os.getenv('DEBUG', 'false').lower() == 'true'
-        self.STATION_ID = os.getenv('STATION_ID')
-        self.TRAIN_LINE_1 = os.getenv('TRAIN_LINE_1')
-        self.TRAIN_LINE_2 = os.getenv('TRAIN_LINE_2')
-        self.WEATHER_ZIP = os.getenv('WEATHER_ZIP', '11231')  # Add default zip code
+        self.WEATHER_KEY = _ENV.get('WEATHER_KEY')
+        self.DEBUG = _ENV.get('DEBUG', 'false').lower() == 'true'
+        self.STATION_ID = _ENV.get('STATION_ID')
+        self.TRAIN_LINE_1 = _ENV.get('TRAIN_LINE_1')
+        self.TRAIN_LINE_2 = _ENV.get('TRAIN_LINE_2')
+        self.WEATHER_ZIP = _ENV.get('WEATHER_ZIP', '11231')  # Add default zip code
         
         if not self.STATION_ID:
             raise ValueError("STATION_ID must be set in .env file")
@@ -124,11 +266,21 @@ class Config:
             }
         }
 
+        # Commute bounds pre-parsed to time objects, so the weather cycle
+        # doesn't re-run strptime for every period on every fetch
+        self.commute_times_parsed = {
+            period: {
+                'start': dt_time(int(t['start'][:2]), int(t['start'][3:])),
+                'end': dt_time(int(t['end'][:2]), int(t['end'][3:])),
+                'label': t['label'],
+            }
+            for period, t in self.commute_times.items()
+        }
+
         # Weather coordinates (defaulting to NYC coordinates if not specified)
-        self.WEATHER_COORDS = (
-            float(os.getenv('WEATHER_LAT', '40.7128')), 
-            float(os.getenv('WEATHER_LON', '-74.0060'))
-        )
+        typed = {name: caster(_ENV.get(name, default))
+                 for name, caster, default in _TYPED_FIELDS}
+        self.WEATHER_COORDS = (typed['WEATHER_LAT'], typed['WEATHER_LON'])
 
 # Create a global configuration instance
-config = Config()
\ No newline at end of file
+config = Config.instance()
\ No newline at end of file
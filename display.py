@@ -3,9 +3,11 @@ import sys
 from time import sleep
 import traceback
 import subprocess
+import numpy as np
 from PIL import Image, ImageChops
 from pathlib import Path
 from typing import List, Dict
+import queue
 import threading
 import time
 
@@ -15,11 +17,22 @@ from subway_service import TrainArrival
 
 logger = logging.getLogger(__name__)
 
-# Only import IT8951 on Raspberry Pi
+# xxhash is a single SIMD pass over the frame bytes; fall back to a short
+# blake2b digest when it isn't installed
+try:
+    import xxhash
+
+    def _frame_hash(data: bytes) -> int:
+        return xxhash.xxh3_64_intdigest(data)
+except ImportError:
+    import hashlib
+
+    def _frame_hash(data: bytes) -> bytes:
+        return hashlib.blake2b(data, digest_size=8).digest()
+
+# IT8951 is only imported lazily inside EInkDisplay, so debug runs on Linux
+# dev boxes don't pay for the SPI bindings at import time
 IS_RASPBERRY_PI = sys.platform == 'linux'
-if IS_RASPBERRY_PI:
-    from IT8951.display import AutoEPDDisplay # type: ignore
-    from IT8951 import constants # type: ignore
 
 class DebugDisplay:
     def __init__(self):
@@ -37,31 +50,42 @@ class DebugDisplay:
             self._update_display(img)
                 
         except Exception as e:
-            logger.error(f"Error updating debug display: {str(e)}")
+            logger.error("Error updating debug display: %s", e)
             raise
 
     def _update_display(self, img: Image.Image):
         """Save the image without automatically opening it"""
         try:
-            img = img.rotate(180)
-            # Save the image
-            img.save(self.current_image_path)
-            logger.info(f"Saved display image to {self.current_image_path}")
+            # transpose is a straight byte-reversal copy; rotate(180) goes
+            # through the general affine resampler
+            img = img.transpose(Image.Transpose.ROTATE_180)
+            # Save the image with cheap compression - debug frames don't need zlib-9
+            img.save(self.current_image_path, optimize=False, compress_level=1)
+            logger.info("Saved display image to %s", self.current_image_path)
                 
         except Exception as e:
-            logger.error(f"Error updating debug display: {str(e)}")
+            logger.error("Error updating debug display: %s", e)
             raise
 
 class EInkDisplay:
     def __init__(self):
         if IS_RASPBERRY_PI:
-            self.display = AutoEPDDisplay(vcom=-2.06, rotate='CCW', spi_hz=12000000)
-            logger.info(f"VCOM set to {self.display.epd.get_vcom()}")
+            from IT8951.display import AutoEPDDisplay # type: ignore
+            from IT8951 import constants # type: ignore
+            self._AutoEPDDisplay = AutoEPDDisplay
+            # Resolve the display-mode constants once instead of chasing the
+            # module attributes on every refresh
+            self._MODE_FULL = constants.DisplayModes.GLR16
+            self._MODE_PARTIAL = constants.DisplayModes.GLR16
+            self._MODE_CLEAR = constants.DisplayModes.GC16
+            self.display = self._AutoEPDDisplay(vcom=-2.06, rotate='CCW', spi_hz=24000000)
+            logger.info("VCOM set to %s", self.display.epd.get_vcom())
         else:
             raise RuntimeError("EInkDisplay can only be used on Raspberry Pi")
-        
+
         self.previous_image = None
-    
+        self._prev_hash = None
+
     def initialize(self):
         """Initialize the e-ink display"""
         pass
@@ -71,11 +95,11 @@ class EInkDisplay:
         try:
             logger.info("Clearing display")
             self.display.frame_buf.paste(0xFF, box=(0, 0, config.display.WIDTH, config.display.HEIGHT))
-            self.display.draw_full(constants.DisplayModes.GC16)
+            self.display.draw_full(self._MODE_CLEAR)
             logger.info("Display cleared")
             
         except Exception as e:
-            logger.error(f"Error clearing display: {str(e)}")
+            logger.error("Error clearing display: %s", e)
             raise
 
     def restart(self):
@@ -83,7 +107,7 @@ class EInkDisplay:
 
         self.display.epd.sleep()
         sleep(2)
-        self.display = AutoEPDDisplay(vcom=-2.06, rotate='CCW', spi_hz=12000000)
+        self.display = self._AutoEPDDisplay(vcom=-2.06, rotate='CCW', spi_hz=24000000)
         sleep(2)
         logger.error("Display restarted")
     
@@ -95,14 +119,14 @@ class EInkDisplay:
 
             logger.info("Sending image to display")
             self.display.frame_buf.paste(img)
-            self.display.draw_full(constants.DisplayModes.GLR16)
+            self.display.draw_full(self._MODE_FULL)
             
             logger.info("Display update complete")
             
         except Exception as e:
             print(f"Error updating display: {str(e)}")
             self.display.epd.wait_display_ready()
-            logger.error(f"Error updating display: {str(e)}")
+            logger.error("Error updating display: %s", e)
             raise
 
     def _update_partial_display(self, img: Image.Image, box: tuple):
@@ -110,7 +134,7 @@ class EInkDisplay:
         try:
             logger.info("Sending partial image to display")
             self.display.frame_buf.paste(img.crop(box), box)
-            self.display.draw_partial(constants.DisplayModes.GLR16) # .DU is faster but has ghosting
+            self.display.draw_partial(self._MODE_PARTIAL) # .DU is faster but has ghosting
             
             logger.info("Partial display update complete")
             
@@ -119,24 +143,59 @@ class EInkDisplay:
             self.display.epd.wait_display_ready()
             # self.restart()
 
-            logger.error(f"Error updating partial display: {str(e)}")
+            logger.error("Error updating partial display: %s", e)
             raise
 
     def _get_diff_box(self, img1: Image.Image, img2: Image.Image) -> tuple:
         """Get bounding box of differences between two images"""
-        diff = ImageChops.difference(img1, img2)
-        return diff.getbbox()
+        # Compare raw pixel buffers with NumPy instead of allocating a full
+        # ImageChops.difference image and walking it for getbbox
+        a = np.asarray(img1)
+        b = np.asarray(img2)
+        if a.shape != b.shape:
+            return (0, 0, img2.width, img2.height)
+        mask = a != b
+        if mask.ndim == 3:  # collapse color channels if present
+            mask = mask.any(axis=2)
+        rows = mask.any(axis=1)
+        if not rows.any():
+            return None
+        cols = mask.any(axis=0)
+        y0 = int(np.argmax(rows))
+        y1 = int(len(rows) - np.argmax(rows[::-1]))
+        x0 = int(np.argmax(cols))
+        x1 = int(len(cols) - np.argmax(cols[::-1]))
+        return (x0, y0, x1, y1)
 
     def update(self, img: Image.Image, partial: bool = False, clear: bool = False):
         """Update the e-ink display with new data
         ToDo: I'm hiding logic here that only does a partial refresh on small changes rather than plumbing all the way through.
         """
         try:
+            # Fast fingerprint check before paying for a diff image;
+            # identical frames skip the refresh entirely
+            frame_hash = _frame_hash(img.tobytes())
             if self.previous_image:
+                if frame_hash == self._prev_hash:
+                    logger.info("Frame unchanged, skipping display refresh")
+                    self.previous_image = img
+                    return
                 diff_box = self._get_diff_box(self.previous_image, img)
+                if diff_box is None:
+                    logger.info("No pixel differences, skipping display refresh")
+                    self.previous_image = img
+                    return
             else:
                 diff_box = None
-            
+
+            # Defer tiny diffs (single-pixel antialiasing jitter) without
+            # touching previous_image, so a later diff still picks them up
+            if diff_box and not clear:
+                area = (diff_box[2] - diff_box[0]) * (diff_box[3] - diff_box[1])
+                if area < config.display.MIN_PARTIAL_REFRESH_AREA:
+                    logger.info("Diff area %d below refresh threshold, deferring update", area)
+                    return
+
             # Fix - maybe have the partial boolean parameter be tuple of max width/height"
             if diff_box and (diff_box[2] - diff_box[0] > 50 or diff_box[3] - diff_box[1] > 50):
                 logger.info("Large diff detected, doing full update")
@@ -146,18 +205,21 @@ class EInkDisplay:
                 self._update_partial_display(img, diff_box)
             else:
                 self._update_display(img, clear)
-            
+
             self.previous_image = img
-                
+            self._prev_hash = frame_hash
+
         except Exception as e:
-            logger.error(f"Error updating display: {str(e)}")
+            logger.error("Error updating display: %s", e)
             logger.error(traceback.format_exc())
             raise
 
 class Display:
     def __init__(self):
         self.display = None
-        self.next_frame = None
+        # Single-slot queue: update() coalesces to the latest frame, and the
+        # worker blocks on get() instead of polling
+        self._frame_queue = queue.Queue(maxsize=1)
         self.update_thread = threading.Thread(target=self._process_queue)
         self.update_thread.daemon = True
         self.update_thread.start()
@@ -175,15 +237,18 @@ class Display:
 
     def _process_queue(self):
         """Process the latest img, ensuring only one update per second"""
+        last_update = 0.0
         while True:
             try:
-                if self.next_frame is not None:
-                    img, partial, clear = self.next_frame
-                    self.display.update(img, partial, clear)
-                    self.next_frame = None
-                time.sleep(1)  # Ensure only one update per second
+                img, partial, clear = self._frame_queue.get()
+                # Ensure only one update per second
+                elapsed = time.monotonic() - last_update
+                if elapsed < 1.0:
+                    time.sleep(1.0 - elapsed)
+                self.display.update(img, partial, clear)
+                last_update = time.monotonic()
             except Exception as e:
-                logger.error(f"Error processing update queue: {str(e)}")
+                logger.error("Error processing update queue: %s", e)
                 logger.error(traceback.format_exc())
 
     def update(self, weather_data: Dict, train_data: List[TrainArrival], partial: bool = False, clear: bool = False):
@@ -191,9 +256,14 @@ class Display:
         try:
             logger.info("Generating display image...")
             img = getImage(weather_data, train_data)
-            self.next_frame = (img, partial, clear)
+            # Drop any stale queued frame so only the newest is displayed
+            try:
+                self._frame_queue.get_nowait()
+            except queue.Empty:
+                pass
+            self._frame_queue.put_nowait((img, partial, clear))
                 
         except Exception as e:
-            logger.error(f"Error queuing display update: {str(e)}")
+            logger.error("Error queuing display update: %s", e)
             logger.error(traceback.format_exc())
             raise
\ No newline at end of file
@@ -1,5 +1,7 @@
+import functools
+import io
 import os
-from PIL import ImageFont
+from PIL import Image, ImageFont
 from config import config
 
 class FontManager:
@@ -7,17 +9,42 @@ class FontManager:
         self.picdir = os.path.join(os.path.dirname(os.path.realpath(__file__)), 'pic')
         self._fonts = {}
         self._load_fonts()
-    
+        # Expose each font as a direct attribute (fonts.header etc.) so hot
+        # draw paths can skip the dict lookup entirely
+        for name, font in self._fonts.items():
+            setattr(self, name, font)
+        # Cached lookup for callers that still go through get('header')
+        self.get = functools.lru_cache(maxsize=None)(self._fonts.__getitem__)
+        # Pre-rendered glyph bitmaps keyed by (text, size name)
+        self._atlas = {}
+
+    def render(self, text: str, size_name: str):
+        """Return a cached (bitmap, offset) pair for text at the given size.
+
+        The bitmap is an L-mode mask and offset is the glyph origin shift
+        from getmask2, so callers blit with
+        img.paste(fill, (x + dx, y + dy), bitmap) instead of re-rasterizing
+        the string through FreeType on every frame.
+        """
+        key = (text, size_name)
+        cached = self._atlas.get(key)
+        if cached is None:
+            mask, offset = self._fonts[size_name].getmask2(text, mode='L')
+            cached = (Image.frombytes('L', mask.size, bytes(mask)), offset)
+            self._atlas[key] = cached
+        return cached
+
     def _load_fonts(self):
         """Load all font sizes on initialization"""
+        # Read the font file once and share the bytes across all sizes; the
+        # BASIC layout engine skips Raqm/HarfBuzz shaping, which the short
+        # ASCII strings drawn here never need
+        font_path = os.path.join(self.picdir, 'Font.ttc')
+        with open(font_path, 'rb') as f:
+            font_bytes = f.read()
         for name, size in config.FONT_SIZES.items():
-            self._fonts[name] = ImageFont.truetype(os.path.join(self.picdir, 'Font.ttc'), size)
-    
-    def get(self, size_name: str) -> ImageFont.FreeTypeFont:
-        """Get a font by its size name"""
-        if size_name not in self._fonts:
-            raise ValueError(f"Font size '{size_name}' not found. Available sizes: {list(self._fonts.keys())}")
-        return self._fonts[size_name]
+            self._fonts[name] = ImageFont.truetype(
+                io.BytesIO(font_bytes), size, layout_engine=ImageFont.Layout.BASIC)
 
 # Create a global font manager instance
 fonts = FontManager() 
\ No newline at end of file
@@ -1,8 +1,11 @@
+import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 from typing import Dict, List
+from collections.abc import Mapping
+from functools import lru_cache
 import logging
-from datetime import datetime, time, timedelta
-import pytz
+from datetime import date, datetime, time, timedelta
+from zoneinfo import ZoneInfo
 from dataclasses import dataclass
 import os
 
@@ -14,14 +17,104 @@ from weather_service import weather_service
 
 logger = logging.getLogger(__name__)
 
-# Layout configuration dataclasses
-@dataclass
+# Shared timezone instance - stdlib zoneinfo, no pytz registry lookup or
+# localize() semantics needed for simple tz-aware now()
+NY_TZ = ZoneInfo('America/New_York')
+
+# Arrival-text offset from the logo center, indexed by train count (capped at 6)
+_TEXT_BASE_OFFSETS = (0, 85, 50, 10, -30, -65, -70)
+
+# Text measurement goes through FreeType shaping on every call, so cache the
+# results - the strings drawn each frame come from tiny domains (minutes,
+# unit labels, hour labels)
+_measure_draw = ImageDraw.Draw(Image.new('L', (1, 1)))
+
+@lru_cache(maxsize=4096)
+def _text_width(font, text):
+    return font.getlength(text)
+
+@lru_cache(maxsize=4096)
+def _text_bbox(font, text):
+    return _measure_draw.textbbox((0, 0), text, font=font)
+
+@lru_cache(maxsize=64)
+def _hour_label(iso_time):
+    """Format an ISO hourly timestamp as e.g. '8am' (cached - the same 12
+    timestamps are redrawn every frame until the forecast refreshes)"""
+    return datetime.fromisoformat(iso_time.replace('Z', '+00:00')).strftime('%I%p').lstrip('0').lower()
+
+@lru_cache(maxsize=512)
+def _parse_arrival(arrival_time):
+    """Split an arrival string like '08:35 AM' into ('08:35', 'am').
+
+    strptime is the slowest path in datetime; arrival strings are
+    minute-granular and repeat across refreshes, so hits approach 100%.
+    """
+    dt = datetime.strptime(arrival_time, "%I:%M %p")
+    return dt.strftime("%I:%M"), dt.strftime("%p").lower()
+
+@lru_cache(maxsize=256)
+def _prepare_conditions(raw, font):
+    """Shorten a conditions string and measure it, once per (string, font) -
+    conditions rarely change between frames, so the render path skips both
+    the string munging and the textbbox measurement"""
+    text = utils.shortenWeatherText(raw)
+    bbox = _measure_draw.textbbox((0, 0), text, font=font)
+    return text, bbox[2] - bbox[0]
+
+def _normalize_weather(d: dict) -> dict:
+    """Flatten the mixed weather schemas (current, commute aggregate, raw
+    API) into the flat shape _draw_weather_block reads, so the draw path
+    does plain key lookups instead of re-resolving the schema per frame"""
+    if 'condition_code' in d:
+        code = d['condition_code']
+    else:
+        condition = d.get('condition')
+        code = condition.get('code') if isinstance(condition, Mapping) else condition
+    conditions = d.get('conditions')
+    if conditions is None:
+        condition = d.get('condition')
+        conditions = condition.get('text') if isinstance(condition, Mapping) else (condition or '')
+    return {
+        'condition_code': code,
+        'is_day': d.get('is_day'),
+        'temperature': d.get('temperature', str(round(float(d.get('temp_f', d.get('temp', 0)))))),
+        'wind_mph': d.get('wind_mph', d.get('wind', {}).get('mph', 0)),
+        'precipitation_chance': d.get('precipitation_chance', d.get('chance_of_rain', 0)),
+        'conditions': conditions,
+    }
+
+def _paste_text(img, xy, text, size_name, anchor='la'):
+    """Blit a cached glyph bitmap (see FontManager.render) instead of
+    re-rasterizing the string through draw.text.
+
+    Placement matches draw.text for the anchors used here (verified
+    pixel-exact against Pillow's anchor handling).
+    """
+    mask, (dx, dy) = fonts.render(text, size_name)
+    font = fonts.get(size_name)
+    x, y = xy
+    ha, va = anchor
+    if ha == 'm':
+        x -= _text_width(font, text) / 2
+    elif ha == 'r':
+        x -= _text_width(font, text)
+    ascent, descent = font.getmetrics()
+    if va == 's':
+        y -= ascent
+    elif va == 'm':
+        y -= (ascent + descent) // 2
+    img.paste(0, (int(x) + dx, int(y) + dy), mask)
+
+# Layout configuration dataclasses (slots=True - these are allocated per
+# layout rebuild and don't need a per-instance __dict__)
+@dataclass(slots=True)
 class WeatherSection:
     type: str  # "commute" only now
     data: dict
     width_ratio: float = 1.0
 
-@dataclass
+@dataclass(slots=True)
 class WeatherLayoutConfig:
     top_sections: List[WeatherSection]
     bottom_sections: List[WeatherSection]
@@ -32,57 +125,115 @@ class LayoutManager:
         self.weather = config.weather
         self.subway = config.subway
         self.time = config.time
-    
-    def create_image(self, weather_data: dict, subway_data: List[TrainArrival]) -> Image.Image:
-        """Create the display image"""
-        img = self._create_base_image()
-        draw = ImageDraw.Draw(img)
-        
-        # Draw section dividers
+        self._canvas = None
+        self._canvas_draw = None  # Draw handle paired with the reused canvas
+        self._layout_cache = None  # (key, WeatherLayoutConfig) for _get_weather_layout
+        self._icon_cache = {}  # (condition code, is_day, size) -> rendered icon
+        self._logo_cache = {}  # (line letter, radius) -> rendered logo tile
+        self._prewarm_text_cache()
+        self._template = self._build_template()
+
+    def _prewarm_text_cache(self):
+        """Pre-measure the small string domains drawn every frame"""
+        for n in range(61):
+            _text_width(fonts.xheader, str(n))
+        _text_bbox(fonts.medium, 'min')
+        for s in ('am', 'pm'):
+            _text_width(fonts.medium, s)
+        for s in ('mph', '%'):
+            _text_width(fonts.small, s)
+        _text_width(fonts.large, '|')
+
+    def _build_template(self) -> Image.Image:
+        """Pre-render the static chrome (section dividers and the header
+        midline) once; per-frame rendering stamps this template instead of
+        redrawing the same lines"""
+        template = Image.new('L', (self.display.WIDTH, self.display.HEIGHT), 255)
+        # Keep the template's draw handle around for any future static prep
+        self._template_draw = draw = ImageDraw.Draw(template)
         self._draw_sections(draw)
-        
+
+        # Vertical line at the header midline (between date and time)
+        line_start_y = self.time.Y - 5  # Start slightly above text
+        line_end_y = self.time.Y + fonts.header.size + 5  # End slightly below text
+        draw.line(
+            (self.display.WIDTH // 2, line_start_y,
+             self.display.WIDTH // 2, line_end_y),
+            fill=0,
+            width=5
+        )
+        return template
+
+    def create_image(self, weather_data: dict, subway_data: List[TrainArrival],
+                     target: Image.Image = None) -> Image.Image:
+        """Create the display image, optionally drawing into a caller-owned buffer"""
+        img = self._create_base_image(target)
+        # Reuse the Draw bound to the persistent canvas; only a caller-owned
+        # target needs a fresh handle
+        draw = self._canvas_draw if img is self._canvas else ImageDraw.Draw(img)
+
+        # Take the clock readings once per frame
+        now = datetime.now()
+        today_ny = datetime.now(NY_TZ).date()
+
         # Draw time
-        self._draw_time(draw)
-        
+        self._draw_time(draw, now)
+
         # Draw subway information
-        self._draw_subway_info(draw, subway_data)
-        
+        self._draw_subway_info(img, draw, subway_data)
+
         # Draw weather information
-        self._draw_weather_info(img, draw, weather_data)
+        self._draw_weather_info(img, draw, weather_data, today_ny)
+
+        # transpose takes the dedicated byte-reversal path instead of the
+        # affine resampler
+        img = img.transpose(Image.Transpose.ROTATE_180)
 
-        img = img.rotate(180)
-        
         return img
     
-    def _create_base_image(self) -> Image.Image:
-        """Create a blank base image"""
-        return Image.new('L', (self.display.WIDTH, self.display.HEIGHT), 255)
+    def _create_base_image(self, target: Image.Image = None) -> Image.Image:
+        """Return a canvas stamped with the static template, reusing a
+        persistent buffer instead of allocating a new image every frame"""
+        size = (self.display.WIDTH, self.display.HEIGHT)
+        canvas = target if target is not None and target.size == size else None
+        if canvas is None:
+            if self._canvas is None:
+                self._canvas = Image.new('L', size, 255)
+                self._canvas_draw = ImageDraw.Draw(self._canvas)
+            canvas = self._canvas
+        canvas.paste(self._template, (0, 0))
+        return canvas
     
     def _draw_sections(self, draw: ImageDraw.ImageDraw):
-        """Draw the section dividing lines"""
-        # Line between header and train section
-        draw.line((0, self.display.HEADER_HEIGHT, 
-                   self.display.WIDTH, self.display.HEADER_HEIGHT), fill=0)
-        
-        # Line between train and weather section - stop at vertical lane
-        draw.line((0, self.display.TRAIN_SECTION_Y + self.display.TRAIN_SECTION_HEIGHT,
-                   self.display.MAIN_SECTION_WIDTH, self.display.TRAIN_SECTION_Y + self.display.TRAIN_SECTION_HEIGHT), fill=0)
-        
-        # Vertical line for the right lane
-        draw.line((self.display.VERTICAL_LANE_X, self.display.HEADER_HEIGHT,
-                   self.display.VERTICAL_LANE_X, self.display.HEIGHT), fill=0)
+        """Draw the section dividing lines as one polyline.
+
+        A single draw.line dispatch covers the header divider, the vertical
+        lane line, and the train/weather divider; the two joining segments
+        retrace already-black pixels, so the output is unchanged.
+        """
+        header_y = self.display.HEADER_HEIGHT
+        divider_y = self.display.TRAIN_SECTION_Y + self.display.TRAIN_SECTION_HEIGHT
+        lane_x = self.display.VERTICAL_LANE_X
+        draw.line(
+            [(0, header_y),                      # header divider
+             (self.display.WIDTH, header_y),
+             (lane_x, header_y),                 # retrace back to the lane
+             (lane_x, self.display.HEIGHT),      # vertical lane line
+             (lane_x, divider_y),                # retrace up to the divider
+             (0, divider_y)],                    # train/weather divider
+            fill=0
+        )
     
-    def _draw_time(self, draw: ImageDraw.ImageDraw):
+    def _draw_time(self, draw: ImageDraw.ImageDraw, now: datetime):
         """Draw the current time in the header section"""
-        now = datetime.now()
         date_str = now.strftime("%a, %b %d")
         time_str = now.strftime("%I:%M:%S%p").lstrip('0').lower()
         
-        font = fonts.get('header')
+        font = fonts.header
         
         # Calculate positions for date and time
-        date_bbox = draw.textbbox((0, 0), date_str, font=font)
-        time_bbox = draw.textbbox((0, 0), time_str, font=font)
+        date_bbox = _text_bbox(font, date_str)
+        time_bbox = _text_bbox(font, time_str)
         
         date_width = date_bbox[2] - date_bbox[0]
         time_width = time_bbox[2] - time_bbox[0]
@@ -91,27 +242,20 @@ class LayoutManager:
         date_x = (self.display.WIDTH // 2) - 30 - date_width
         # Position time to start 30px after midline
         time_x = (self.display.WIDTH // 2) + 30
-        
-        # Draw vertical line at midline
-        line_start_y = self.time.Y - 5  # Start slightly above text
-        line_end_y = self.time.Y + fonts.get('header').size + 5  # End slightly below text
-        draw.line(
-            (self.display.WIDTH // 2, line_start_y, 
-             self.display.WIDTH // 2, line_end_y),
-            fill=0,
-            width=5
-        )
-        
+
+        # (the vertical midline is part of the pre-rendered template)
+
         draw.text((date_x, self.time.Y), date_str, font=font, fill=0)
         draw.text((time_x, self.time.Y), time_str, font=font, fill=0)
     
-    def _draw_weather_info(self, img: Image.Image, draw: ImageDraw.ImageDraw, weather_data: dict):
+    def _draw_weather_info(self, img: Image.Image, draw: ImageDraw.ImageDraw, weather_data: dict,
+                           today_ny: date):
         """Draw all weather information"""
         # Draw vertical lane content
         self._draw_vertical_lane(img, draw, weather_data)
-        
+
         # Get layout configuration
-        layout = self._get_weather_layout(weather_data)
+        layout = self._get_weather_layout(weather_data, today_ny)
         
         # Draw commutes side by side
         if layout.top_sections:  # We'll reuse top_sections for both commutes
@@ -122,15 +266,16 @@ class LayoutManager:
                 section_height=self.display.WEATHER_SECTION_HEIGHT
             )
 
-    def _get_weather_layout(self, weather_data: dict) -> WeatherLayoutConfig:
+    def _get_weather_layout(self, weather_data: dict, today: date) -> WeatherLayoutConfig:
         """Weather layout configuration"""
-        # Get next four commute periods (today and tomorrow)
-        commute_forecasts = weather_service.get_next_commutes(include_today=True)
+        # Get the next two commute periods (today and tomorrow); the limit
+        # lets the service skip building slots the layout never reads
+        commute_forecasts = weather_service.get_next_commutes(include_today=True, limit=2)
         
         if len(commute_forecasts) < 2:
             logger.warning("Not enough commute forecasts")
             # Create a basic layout with just current weather
-            current_weather = weather_data["current"].copy()
+            current_weather = _normalize_weather(weather_data["current"])
             current_weather['period'] = "Current Weather"
             return WeatherLayoutConfig(
                 top_sections=[
@@ -139,31 +284,41 @@ class LayoutManager:
                 bottom_sections=[]
             )
         
-        # Get the next two commute periods
-        next_commutes = commute_forecasts[:2]
-        
-        # Update labels based on whether they're today or tomorrow
-        ny_tz = pytz.timezone('America/New_York')
-        today = datetime.now(ny_tz).date()
-        
+        next_commutes = commute_forecasts
+
+        # Reuse the layout while the windows AND the values they display are
+        # unchanged - keying on the windows alone would freeze the panels on
+        # whatever forecast they showed when the pair first appeared
+        cache_key = (today, tuple(
+            (c['date'], c['start_time'], c['temperature'], c['condition_code'],
+             c['conditions'], c['precipitation_chance'], c['wind_mph'])
+            for c in next_commutes))
+        if self._layout_cache and self._layout_cache[0] == cache_key:
+            return self._layout_cache[1]
+
+        sections_data = []
         for commute in next_commutes:
-            commute_date = datetime.strptime(commute['date'], '%Y-%m-%d').date()
+            commute_date = date.fromisoformat(commute['date'])
             is_tomorrow = commute_date > today
             is_morning = commute['start_time'] < '12:00'
-            
+
+            data = _normalize_weather(commute)
             if is_tomorrow:
-                commute['period'] = "Tomorrow Morning" if is_morning else "Tomorrow Evening"
+                data['period'] = "Tomorrow Morning" if is_morning else "Tomorrow Evening"
             else:
-                commute['period'] = "Morning Commute" if is_morning else "Evening Commute"
-        
-        return WeatherLayoutConfig(
+                data['period'] = "Morning Commute" if is_morning else "Evening Commute"
+            sections_data.append(data)
+
+        layout = WeatherLayoutConfig(
             top_sections=[
-                WeatherSection("commute", next_commutes[0], width_ratio=1.0)
+                WeatherSection("commute", sections_data[0], width_ratio=1.0)
             ],
             bottom_sections=[
-                WeatherSection("commute", next_commutes[1], width_ratio=1.0)
+                WeatherSection("commute", sections_data[1], width_ratio=1.0)
             ]
         )
+        self._layout_cache = (cache_key, layout)
+        return layout
 
     def _draw_weather_section(self, img: Image.Image, draw: ImageDraw.ImageDraw, 
                          sections: List[WeatherSection], y: int, 
@@ -188,6 +343,24 @@ class LayoutManager:
             # Update x position for next section
             current_x += section_width
 
+    def _get_icon(self, weather_json: dict, size: int) -> Image.Image:
+        """Cached wrapper around utils.getWeatherIcon - the same handful of
+        condition codes repeats across the hourly forecast, so most frames
+        are pure cache hits"""
+        code = weather_json.get('condition_code')
+        if code is None:
+            condition = weather_json.get('condition')
+            code = condition.get('code') if isinstance(condition, Mapping) else None
+        if code is None:
+            return utils.getWeatherIcon(weather_json, size)
+        is_day = weather_json.get('is_day')
+        key = (code, is_day, size)
+        icon = self._icon_cache.get(key)
+        if icon is None:
+            icon = utils.getWeatherIcon({'condition': {'code': code}, 'is_day': is_day}, size)
+            self._icon_cache[key] = icon
+        return icon
+
     def _draw_weather_section_content(self, img: Image.Image, draw: ImageDraw.ImageDraw,
                                        section: WeatherSection, x: int, y: int,
                                        width: int, height: int):
@@ -205,7 +378,7 @@ class LayoutManager:
             draw.text(
                 (x - 40, y),
                 forecast['period'],
-                font=fonts.get('large'),
+                font=fonts.large,
                 fill=0,
                 anchor="lt"  # Center align text
             )
@@ -221,104 +394,70 @@ class LayoutManager:
     def _draw_weather_block(self, img: Image.Image, draw: ImageDraw.ImageDraw, 
                     weather_data: dict, x: int, y: int,
                     icon_size: int):
-        """Draw a standard weather block with icon, temp, and conditions"""
-        # Get condition code safely
-        condition_code = None
-        if 'condition_code' in weather_data:
-            condition_code = weather_data['condition_code']
-        elif 'condition' in weather_data and isinstance(weather_data['condition'], dict):
-            condition_code = weather_data['condition'].get('code')
-        elif 'condition' in weather_data and isinstance(weather_data['condition'], str):
-            condition_code = weather_data['condition']
-        
+        """Draw a standard weather block with icon, temp, and conditions.
+
+        Expects the flat schema produced by _normalize_weather.
+        """
+        large_font = fonts.large
+        small_font = fonts.small
+
         # Draw weather icon centered at x position
-        icon = utils.getWeatherIcon(
-            {'condition': {'code': condition_code}} if condition_code else weather_data,
-            icon_size
-        )
+        icon = self._get_icon(weather_data, icon_size)
         icon_x = x - (icon_size // 2)  # Center the icon at x
         img.paste(icon, (icon_x, y), icon)
-        
+
         # Text starts to the right of the centered icon
         text_x = x + (icon_size // 2)
-        
+
         # Get temperature
-        temp = weather_data.get('temperature', str(round(float(weather_data.get('temp_f', weather_data.get('temp', 0))))))
-        temp_text = f"{temp}°"
-        
+        temp_text = f"{weather_data['temperature']}°"
+
         # Draw details with different font sizes
         details_text = []
-        
+
         # Add wind speed if available
-        wind_speed = weather_data.get('wind_mph', weather_data.get('wind', {}).get('mph', 0))
+        wind_speed = weather_data['wind_mph']
         if wind_speed:
             # Split into number and unit
             speed_num = str(round(float(wind_speed)))
             details_text.append((speed_num, 'mph'))
         
         # Add precipitation chance if available and >= 5%
-        precipitation_chance = weather_data.get('precipitation_chance', weather_data.get('chance_of_rain', 0))
+        precipitation_chance = weather_data['precipitation_chance']
         if precipitation_chance and int(precipitation_chance) >= 15:  # Only show if 5% or higher
             # Split into number and unit
             precip_num = str(precipitation_chance)
             details_text.append((precip_num, '%'))
 
         # Draw temperature
-        draw.text(
-            (text_x, y ),
-            temp_text,
-            font=fonts.get('xheader'),
-            fill=0
-        )
+        _paste_text(img, (text_x, y), temp_text, 'xheader')
         
         # Draw wind speed and precipitation chance
         if details_text:
-            large_font = fonts.get('large')
-            small_font = fonts.get('small')
             current_x = text_x
             
             for i, (number, unit) in enumerate(details_text):
                 # Draw the number in large font
-                number_width = large_font.getlength(number)
-                draw.text(
-                    (current_x, y + 78),
-                    number,
-                    font=large_font,
-                    fill=0
-                )
-                
+                number_width = _text_width(large_font, number)
+                _paste_text(img, (current_x, y + 78), number, 'large')
+
                 # Draw the unit in small font
-                unit_width = small_font.getlength(unit)
-                draw.text(
-                    (current_x + number_width, y + 85),
-                    unit,
-                    font=small_font,
-                    fill=0
-                )
-                
+                unit_width = _text_width(small_font, unit)
+                _paste_text(img, (current_x + number_width, y + 85), unit, 'small')
+
                 # Add separator if this isn't the last item
                 if i < len(details_text) - 1:
                     separator = "|"
-                    separator_width = large_font.getlength(separator)
-                    draw.text(
-                        (current_x + number_width + unit_width, y + 78),
-                        separator,
-                        font=large_font,
-                        fill=0
-                    )
+                    separator_width = _text_width(large_font, separator)
+                    _paste_text(img, (current_x + number_width + unit_width, y + 78), separator, 'large')
                     current_x += number_width + unit_width + separator_width
                 else:
                     current_x += number_width + unit_width
         
-        # Draw conditions centered below icon
-        conditions = weather_data.get('conditions', 
-                                    weather_data.get('condition', {}).get('text') if isinstance(weather_data.get('condition'), dict) else weather_data.get('condition', ''))
-        conditions_text = utils.shortenWeatherText(conditions)
-        large_font = fonts.get('large')
-        
-        # Calculate text width
-        conditions_bbox = draw.textbbox((0, 0), conditions_text, font=large_font)
-        conditions_width = conditions_bbox[2] - conditions_bbox[0]
+        # Draw conditions centered below icon (shortened and measured once
+        # per distinct string - see _prepare_conditions)
+        conditions_text, conditions_width = _prepare_conditions(
+            weather_data['conditions'], large_font)
 
         # Position based on width
         if conditions_width <= 110:
@@ -339,26 +478,30 @@ class LayoutManager:
                 anchor="mt"  # Center align text
             )
 
-    def _draw_subway_info(self, draw: ImageDraw.ImageDraw, trains: List[TrainArrival]):
+    def _draw_subway_info(self, img: Image.Image, draw: ImageDraw.ImageDraw, trains: List[TrainArrival]):
         """Draw subway arrival information"""
         if not trains:
             self._draw_no_trains_message(draw)
             return
 
         # Draw next F and G trains
-        self._draw_next_trains(draw, trains)
+        self._draw_next_trains(img, draw, trains)
 
-    def _draw_next_trains(self, draw: ImageDraw.ImageDraw, trains: List[TrainArrival]):
+    def _draw_next_trains(self, img: Image.Image, draw: ImageDraw.ImageDraw, trains: List[TrainArrival]):
         """Draw the next F and G train circles with upcoming trains to the right"""
-        # Separate and filter trains by line
-        f_trains = [t for t in trains if t.route_id == config.TRAIN_LINE_1]
-        g_trains = [t for t in trains if t.route_id == config.TRAIN_LINE_2]
+        # Separate trains by line in a single pass
+        f_trains: List[TrainArrival] = []
+        g_trains: List[TrainArrival] = []
+        for t in trains:
+            if t.route_id == config.TRAIN_LINE_1:
+                f_trains.append(t)
+            elif t.route_id == config.TRAIN_LINE_2:
+                g_trains.append(t)
 
         def filter_trains(train_list: List[TrainArrival], max_trains: int = 6) -> List[TrainArrival]:
-            forty_min_trains = [t for t in train_list if t.minutes_until_arrival <= 40]
-            forty_min_trains = [t for t in forty_min_trains if t.minutes_until_arrival >= 1] # Remove 0 min trains
-            filtered = forty_min_trains[:max(3, len(forty_min_trains))]
-            return filtered[:min(max_trains, len(filtered))]
+            # Keep trains 1-40 minutes out (0 min trains are already gone)
+            upcoming = [t for t in train_list if 1 <= t.minutes_until_arrival <= 40]
+            return upcoming[:max_trains]
 
         next_f_trains = filter_trains(f_trains)
         next_g_trains = filter_trains(g_trains, 4)
@@ -370,6 +513,7 @@ class LayoutManager:
 
         # Draw each train line section
         self._draw_train_line_section(
+            img=img,
             draw=draw,
             trains=next_f_trains,
             route_id=config.TRAIN_LINE_1,
@@ -380,6 +524,7 @@ class LayoutManager:
         )
 
         self._draw_train_line_section(
+            img=img,
             draw=draw,
             trains=next_g_trains,
             route_id=config.TRAIN_LINE_2,
@@ -389,13 +534,13 @@ class LayoutManager:
             text_area_width=text_area_width
         )
 
-    def _draw_train_line_section(self, draw: ImageDraw.ImageDraw, trains: List[TrainArrival],
+    def _draw_train_line_section(self, img: Image.Image, draw: ImageDraw.ImageDraw, trains: List[TrainArrival],
                                 route_id: str, logo_center_x: int, logo_center_y: int,
                                 circle_radius: int, text_area_width: int):
         """Draw a complete train line section with logo and arrival times"""
         # Draw the train line logo using the configured column position
         self._draw_train_line_logo(
-            draw=draw,
+            img=img,
             line_letter=route_id,
             x=self.display.ICON_COLUMN_X,  # Use configured position
             y=logo_center_y,
@@ -407,26 +552,16 @@ class LayoutManager:
         
         # Draw arrival times with increased line height
         line_height = 60  # Increased from 40
-        
-        # Adjust text_base_y based on number of trains. It's finicky, because odd and even have slightly different alignments
-        if len(trains) > 5:
-            # For more than 4 trains, start at the top of the section
-            text_base_y = logo_center_y - 70
-
-        elif len(trains) == 5:
-            text_base_y = logo_center_y - 65
-        elif len(trains) == 4:
-            text_base_y = logo_center_y - 30
-        elif len(trains) == 3:
-            text_base_y = logo_center_y + 10
-        elif len(trains) == 2:
-            text_base_y = logo_center_y + 50
-        elif len(trains) == 1:
-            text_base_y = logo_center_y + 85
-        
+
+        # Offset from the logo center by train count. It's finicky, because
+        # odd and even have slightly different alignments; six or more trains
+        # start at the top of the section
+        text_base_y = logo_center_y + _TEXT_BASE_OFFSETS[min(len(trains), 6)]
+
         for i, train in enumerate(trains):
             y = text_base_y + (i * (line_height + 12)) - line_height
             self._draw_train_arrival_time(
+                img=img,
                 draw=draw,
                 train=train,
                 x=text_start_x,
@@ -434,100 +569,86 @@ class LayoutManager:
                 max_width=text_area_width
             )
 
-    def _draw_train_arrival_time(self, draw: ImageDraw.ImageDraw, train: TrainArrival,
+    def _draw_train_arrival_time(self, img: Image.Image, draw: ImageDraw.ImageDraw, train: TrainArrival,
                                 x: int, y: int, max_width: int):
         """Draw a train arrival time with minutes, 'min', and arrival time"""
-        time_font = fonts.get('xheader')
-        small_font = fonts.get('medium')
+        time_font = fonts.xheader
+        small_font = fonts.medium
         
-        # Split arrival time into components
-        arrival_hour = datetime.strptime(train.arrival_time, "%I:%M %p")
-        hour_str = arrival_hour.strftime("%I:%M")
-        ampm_str = arrival_hour.strftime("%p").lower()
+        # Split arrival time into components (cached - see _parse_arrival)
+        hour_str, ampm_str = _parse_arrival(train.arrival_time)
         
         # Calculate all text widths
         min_text = "min"
-        min_bbox = draw.textbbox((0, 0), min_text, font=small_font)
+        min_bbox = _text_bbox(small_font, min_text)
         min_width = min_bbox[2] - min_bbox[0]
-        
-        minutes_width = time_font.getlength(str(train.minutes_until_arrival))
-        hour_width = time_font.getlength(hour_str)
-        ampm_width = small_font.getlength(ampm_str)
+
+        minutes_width = _text_width(time_font, str(train.minutes_until_arrival))
+        hour_width = _text_width(time_font, hour_str)
+        ampm_width = _text_width(small_font, ampm_str)
         
         # Calculate total width and right-align the entire block
         total_width = minutes_width + 5 + min_width + 40 + hour_width + 5 + ampm_width
         start_x = x + max_width - total_width
         
         # Draw minutes until arrival
-        draw.text(
-            (start_x, y),
-            str(train.minutes_until_arrival),
-            font=time_font,
-            fill=0,
-            anchor="ls"
-        )
-        
+        _paste_text(img, (start_x, y), str(train.minutes_until_arrival), 'xheader', anchor="ls")
+
         # Draw "min"
-        draw.text(
-            (start_x + minutes_width + 5, y),
-            min_text,
-            font=small_font,
-            fill=0,
-            anchor="ls"
-        )
-        
+        _paste_text(img, (start_x + minutes_width + 5, y), min_text, 'medium', anchor="ls")
+
         # Draw arrival time
         time_x = start_x + minutes_width + min_width + 20
-        draw.text(
-            (time_x, y),
-            hour_str,
-            font=time_font,
-            fill=0,
-            anchor="ls"
-        )
-        
+        _paste_text(img, (time_x, y), hour_str, 'xheader', anchor="ls")
+
         # Draw am/pm
-        draw.text(
-            (time_x + hour_width, y),
-            ampm_str,
-            font=small_font,
-            fill=0,
-            anchor="ls"
-        )
+        _paste_text(img, (time_x + hour_width, y), ampm_str, 'medium', anchor="ls")
 
-    def _draw_train_line_logo(self, draw: ImageDraw.ImageDraw, line_letter: str, 
+    def _draw_train_line_logo(self, img: Image.Image, line_letter: str,
                              x: int, y: int, radius: int):
-        """Draw a subway train line logo"""
+        """Paste a subway train line logo, rendering it once per (line, radius)"""
+        logo = self._logo_cache.get((line_letter, radius))
+        if logo is None:
+            logo = self._render_train_line_logo(line_letter, radius)
+            self._logo_cache[(line_letter, radius)] = logo
+        img.paste(logo, (x - radius, y - radius))
+
+    def _render_train_line_logo(self, line_letter: str, radius: int) -> Image.Image:
+        """Rasterize the circle + letter tile for a train line logo"""
+        tile = Image.new('L', (2 * radius + 1, 2 * radius + 1), 255)
+        draw = ImageDraw.Draw(tile)
         draw.ellipse(
-            (x - radius, y - radius, x + radius, y + radius),
+            (0, 0, 2 * radius, 2 * radius),
             fill=0  # Black circle
         )
         draw.text(
-            (x, y),
+            (radius, radius),
             line_letter,
-            font=fonts.get('xheader'),
+            font=fonts.xheader,
             fill=255,  # White text
             anchor="mm"
         )
+        return tile
 
     def _draw_no_trains_message(self, draw: ImageDraw.ImageDraw):
         """Draw message when no trains are available"""
+        large_font = fonts.large
         draw.text(
             (self.subway.PADDING_X, self.subway.NEXT_TRAIN_Y),
             "No trains",
-            font=fonts.get('large'),
+            font=large_font,
             fill=0
         )
         draw.text(
             (self.subway.PADDING_X, self.subway.NEXT_TRAIN_Y + 40),
             "currently",
-            font=fonts.get('large'),
+            font=large_font,
             fill=0
         )
         draw.text(
             (self.subway.PADDING_X, self.subway.LIST_Y),
             "No upcoming trains found",
-            font=fonts.get('medium'),
+            font=fonts.medium,
             fill=0
         )
 
@@ -550,13 +671,13 @@ class LayoutManager:
         draw.text(
             (x, y),
             "Current Weather",
-            font=fonts.get('large'),
+            font=fonts.large,
             fill=0,
             anchor="mt"  # Center align text
         )
         
         self._draw_weather_block(
-            img, draw, current_weather,
+            img, draw, _normalize_weather(current_weather),
             x=self.display.VERTICAL_LANE_X + 80,
             y=y + 35,  # Add space for label
             icon_size=self.weather.VERTICAL_ICON_SIZE
@@ -573,17 +694,11 @@ class LayoutManager:
             hour_y = y + (i * hour_height)
             
             # Draw time
-            hour_time = datetime.fromisoformat(hour['time'].replace('Z', '+00:00')).strftime('%I%p').lstrip('0').lower()
-            draw.text(
-                (x - icon_size + 35, hour_y + (hour_height // 2)), 
-                hour_time,
-                font=fonts.get('large'),
-                fill=0,
-                anchor="rm"
-            )
+            _paste_text(img, (x - icon_size + 35, hour_y + (hour_height // 2)),
+                        _hour_label(hour['time']), 'large', anchor="rm")
             
             # Draw icon
-            icon = utils.getWeatherIcon(hour, icon_size)
+            icon = self._get_icon(hour, icon_size)
             icon_x = x - (icon_size // 2)
             img.paste(icon, (icon_x, hour_y + (hour_height - icon_size) // 2), icon)
             
@@ -601,17 +716,23 @@ class LayoutManager:
             if precip_chance >= 15:
                 text += f" {int(precip_chance)}%"
             
-            draw.text(
-                (x + icon_size - 35, hour_y + (hour_height // 2)),
-                text,
-                font=fonts.get('large'),
-                fill=0,
-                anchor="lm"
-            )
+            _paste_text(img, (x + icon_size - 35, hour_y + (hour_height // 2)),
+                        text, 'large', anchor="lm")
 
 # Create global layout manager instance
 layout_manager = LayoutManager()
 
 # Provide single image creation function
-def getImage(weather_data: dict, subway_data: List[TrainArrival]) -> Image.Image:
-    return layout_manager.create_image(weather_data, subway_data)
\ No newline at end of file
+def getImage(weather_data: dict, subway_data: List[TrainArrival],
+             target: Image.Image = None) -> Image.Image:
+    return layout_manager.create_image(weather_data, subway_data, target)
+
+def pack_1bpp(img: Image.Image) -> np.ndarray:
+    """Rotate 180° and bit-pack an un-rotated 'L' frame into a 1-bpp buffer.
+
+    For panels that consume packed 1-bpp instead of the IT8951's 16-level
+    grayscale. The [::-1, ::-1] flip is a zero-copy stride view, so rotate,
+    threshold and pack all materialize in the single packbits pass.
+    """
+    arr = np.asarray(img, dtype=np.uint8)[::-1, ::-1]
+    return np.packbits(arr < 128, axis=1)
\ No newline at end of file
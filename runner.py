@@ -1,17 +1,20 @@
 # Now import other modules
+import atexit
 import os
+import queue
 import sys
 from datetime import datetime
 import traceback
 import time
 from typing import Optional, Dict, List
 from dataclasses import dataclass
-from subway_service import subway_service, TrainArrival
+from subway_service import subway_service, top_train_fields, TrainArrival
 from weather_service import weather_service
 from config import config
 from display import Display
 import logging
 import logging.handlers
+import threading
 
 # Set up logging configuration
 log_file = 'log.txt'
@@ -25,18 +28,28 @@ else:
 
 # Ensure log directory exists
 try:
+    # Hot paths only enqueue log records; the listener thread owns the real
+    # handlers and does the formatting + file/stream I/O off-thread
+    _formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    _rotating_handler = logging.handlers.RotatingFileHandler(
+        log_file,
+        maxBytes=max_bytes,
+        backupCount=3  # Without this, rotation truncates in place
+    )
+    _rotating_handler.setFormatter(_formatter)
+    _stream_handler = logging.StreamHandler() if not os.getenv('QUIET_MODE') else logging.NullHandler()
+    _stream_handler.setFormatter(_formatter)
+
+    _log_queue = queue.SimpleQueue()
     logging.basicConfig(
         level=log_level,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.handlers.RotatingFileHandler(
-                log_file,
-                maxBytes=max_bytes
-            ),
-            logging.StreamHandler() if not os.getenv('QUIET_MODE') else logging.NullHandler()
-        ],
+        handlers=[logging.handlers.QueueHandler(_log_queue)],
         force=True
     )
+    _log_listener = logging.handlers.QueueListener(
+        _log_queue, _rotating_handler, _stream_handler)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
 except Exception as e:
     print(f"Error setting up logging: {str(e)}")
     raise
@@ -57,7 +70,22 @@ class Runner:
         self.display = Display()
         self.state = DisplayState()
         self.min_interval = 1
-        self._previous_top_trains: tuple[Optional[TrainArrival], Optional[TrainArrival]] = (None, None)
+        # Top-two train identity stored as flat (ids, minutes) tuples so
+        # change detection is plain tuple equality, no TrainArrival.__eq__
+        self._top_ids: tuple = ()
+        self._top_mins: tuple = ()
+        # Signalled by the update handlers so the main loop sleeps until
+        # something actually changes instead of polling at 1 Hz
+        self._wake = threading.Event()
+        # Pending debounced refresh; bursts of updates collapse into one
+        self._refresh_timer: Optional[threading.Timer] = None
+        self._refresh_lock = threading.Lock()
+        # Serializes renders - the debounce timer, hourly clear and wake
+        # loop can all reach _update_display concurrently, and the
+        # display queue's drain-then-fill isn't atomic
+        self._render_lock = threading.Lock()
+        # Timer armed for the next HH:00 full clear
+        self._clear_timer: Optional[threading.Timer] = None
     
     def handle_weather_update(self, weather_data: Dict):
         """Handle incoming weather updates"""
@@ -65,21 +93,22 @@ class Runner:
         self.state.last_weather_change = time.time()
         self.state.last_display_clear = time.time()
         self._check_display_update(force=False)
+        self._wake.set()
     
     def handle_train_update(self, trains: List[TrainArrival]):
         """Handle incoming train updates"""
         now = datetime.now()
         logger.info("-" * 40)
-        logger.info(f"Train update at {now.strftime('%Y-%m-%d %H:%M:%S')}")
-        logger.info(f"Number of trains: {len(trains)}")
-        
-        for train in trains:
-            logger.debug(f"Train: {train.arrival_time} ({train.minutes_until_arrival} min)")
+        logger.info("Train update at %s", now.strftime('%Y-%m-%d %H:%M:%S'))
+        logger.info("Number of trains: %d", len(trains))
+
+        if logger.isEnabledFor(logging.DEBUG):
+            for train in trains:
+                logger.debug("Train: %s (%d min)", train.arrival_time, train.minutes_until_arrival)
         
         try:
             self.state.train_data = trains
-            current_top_trains = self._get_top_two_trains(trains)
-            if self._has_significant_change(current_top_trains):
+            if self._has_significant_change(top_train_fields(trains)):
                 self._check_display_update(force=True)
             else:
                 # No significant change; don't force update
@@ -87,84 +116,90 @@ class Runner:
         except Exception as e:
             logger.error(f"Error processing trains: {str(e)}")
             logger.error(traceback.format_exc())
+        finally:
+            self._wake.set()
     
-    def _get_top_two_trains(self, trains: List[TrainArrival]) -> tuple[Optional[TrainArrival], Optional[TrainArrival]]:
-        """Get the first two trains from the list"""
-        return (
-            trains[0] if len(trains) > 0 else None,
-            trains[1] if len(trains) > 1 else None
-        )
-    
-    def _has_significant_change(self, current_trains: tuple[Optional[TrainArrival], Optional[TrainArrival]]) -> bool:
+    def _has_significant_change(self, current_fields: tuple[tuple, tuple]) -> bool:
         """Check if there's been a significant change in train times"""
-        if not self._previous_top_trains[0] and current_trains[0]:
-            return True  # First train appeared
-        if not current_trains[0]:
+        ids, mins = current_fields
+        if not ids:
             return True  # No trains (should show no trains message)
-            
-        # Check if either of the top two trains have changed
-        for prev, curr in zip(self._previous_top_trains, current_trains):
-            if prev and curr:
-                if (prev.train_id != curr.train_id or 
-                    prev.minutes_until_arrival != curr.minutes_until_arrival):
-                    return True
-            elif prev != curr:  # One is None and the other isn't
-                return True
-        
-        return False
+        return (ids, mins) != (self._top_ids, self._top_mins)
     
     def _check_display_update(self, force: bool = False):
         """Check if we should update the display"""
-        now = time.time()
-        
         # Don't update if we don't have both weather and train data
         if not self.state.weather_data or self.state.train_data is None:
             return
-            
-        # Always update if this is our first update
-        if self.state.last_display_update == 0:
-            self._update_display()
-            return
-        
-        # If forced (train changes), update immediately
-        if force:
-            self._update_display()
-            return
-        
-        # Clear the display at least once every hour
-        if (now - self.state.last_display_clear >= 3500):
-            current_time = datetime.now()
-            if (current_time.minute == 0):
-                self._update_display(True)
-            return
-            
-        # For weather changes, respect the minimum interval
-        time_since_update = now - self.state.last_display_update
 
-        if (time_since_update >= self.min_interval ):
-            self._update_display()
+        # First update and forced updates (train changes) render immediately
+        if force or self.state.last_display_update == 0:
+            self._schedule_refresh(0)
             return
-    
-    def _update_display(self, clear: bool = False):
-        """Update the display with current state"""
+
+        # Debounce everything else: a burst of weather/train updates
+        # collapses into a single refresh after min_interval. The hourly
+        # clear runs off its own timer (_schedule_hourly_clear)
+        self._schedule_refresh(self.min_interval)
+
+    def _schedule_hourly_clear(self):
+        """Arm a timer for the next HH:00 so the full clear fires exactly
+        once per hour instead of being re-checked on every update"""
+        self._clear_timer = threading.Timer(
+            self._seconds_until_next_hour(), self._hourly_clear)
+        self._clear_timer.daemon = True
+        self._clear_timer.start()
+
+    def _hourly_clear(self):
         try:
+            if self.state.weather_data and self.state.train_data is not None:
+                self._update_display(clear=True)
+        finally:
+            self._schedule_hourly_clear()
 
-            self.display.update(
-                weather_data=self.state.weather_data,
-                train_data=self.state.train_data or [],
-                partial=True,
-                clear=clear
-            )
+    def _schedule_refresh(self, delay: float):
+        """(Re)arm the debounced refresh; delay 0 renders right away"""
+        with self._refresh_lock:
+            if self._refresh_timer is not None:
+                self._refresh_timer.cancel()
+                self._refresh_timer = None
+            if delay > 0:
+                self._refresh_timer = threading.Timer(delay, self._update_display)
+                self._refresh_timer.daemon = True
+                self._refresh_timer.start()
+                return
+        # Render outside _refresh_lock so a slow e-ink refresh can't block
+        # the other schedulers from (re)arming timers
+        self._update_display()
 
-            if (clear == True):
-                self.state.last_display_clear = time.time()
 
-            self.state.last_display_update = time.time()
-            # Update the previous top trains after updating the display
-            self._previous_top_trains = self._get_top_two_trains(self.state.train_data)
-        except Exception as e:
-            logger.error(f"Error updating display: {str(e)}")
+    def _update_display(self, clear: bool = False):
+        """Update the display with current state (one render at a time)"""
+        with self._render_lock:
+            try:
+
+                self.display.update(
+                    weather_data=self.state.weather_data,
+                    train_data=self.state.train_data or [],
+                    partial=True,
+                    clear=clear
+                )
+
+                if (clear == True):
+                    self.state.last_display_clear = time.time()
+
+                self.state.last_display_update = time.time()
+                # Update the previous top trains after updating the display
+                self._top_ids, self._top_mins = top_train_fields(self.state.train_data or [])
+            except Exception as e:
+                logger.error(f"Error updating display: {str(e)}")
     
+    @staticmethod
+    def _seconds_until_next_hour() -> float:
+        """Seconds until the next HH:00, used as the idle wait timeout"""
+        now = datetime.now()
+        return ((59 - now.minute) * 60) + (60 - now.second)
+
     def run(self):
         """Main run method"""
         try:
@@ -180,11 +215,16 @@ class Runner:
             # Start update services
             weather_service.start_updates(interval_seconds=300)  # 5 minutes
             subway_service.start_updates(interval_seconds=5)    # 5 seconds
-            
-            # Keep the main thread running
+
+            # Schedule the once-an-hour full clear
+            self._schedule_hourly_clear()
+
+            # Keep the main thread running; sleep until an update handler
+            # signals
             try:
                 while True:
-                    time.sleep(1)
+                    self._wake.wait()
+                    self._wake.clear()
                     self._check_display_update()
             except KeyboardInterrupt:
                 logger.info("Shutting down...")
@@ -193,6 +233,10 @@ class Runner:
             logger.error(f"Error in main runner: {str(e)}")
         finally:
             # Clean shutdown
+            if self._refresh_timer is not None:
+                self._refresh_timer.cancel()
+            if self._clear_timer is not None:
+                self._clear_timer.cancel()
             subway_service.stop_updates()
             weather_service.stop_updates()
 
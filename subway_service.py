@@ -6,22 +6,53 @@ from nyct_gtfs import NYCTFeed, Trip
 from config import config
 import time
 import threading
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# The GTFS-RT feed only updates server-side every ~15-30s, so feeds fetched
+# within this window are reused instead of re-downloaded
+FEED_TTL_SECONDS = 10
+
+# Formatted "HH:MM AM" strings keyed by (hour, minute) - strftime goes
+# through locale lookups, so each wall-clock minute is formatted only once
+_arrival_fmt_cache: dict = {}
+
+def top_train_fields(trains: List["TrainArrival"], n: int = 2) -> tuple:
+    """Flat (train_ids, minutes) tuples for the first n trains.
+
+    Change detection in both SubwayService and Runner compares these keys
+    with a single tuple equality instead of walking TrainArrival objects.
+    """
+    top = trains[:n]
+    return (tuple(t.train_id for t in top),
+            tuple(t.minutes_until_arrival for t in top))
+
+def _format_arrival(t: datetime) -> str:
+    key = (t.hour, t.minute)
+    cached = _arrival_fmt_cache.get(key)
+    if cached is None:
+        cached = _arrival_fmt_cache[key] = t.strftime("%I:%M %p")
+    return cached
+
+@dataclass(frozen=True, slots=True, eq=False)
 class TrainArrival:
     minutes_until_arrival: int
     arrival_time: str
     train_id: str
     route_id: str
-    
+
     def __eq__(self, other):
         if not isinstance(other, TrainArrival):
             return False
         return (self.minutes_until_arrival == other.minutes_until_arrival and
                 self.train_id == other.train_id)
 
+    def __hash__(self):
+        return hash((self.minutes_until_arrival, self.train_id))
+
 class SubwayService:
     def __init__(self):
         logger.info("Initializing SubwayService")
@@ -30,8 +61,19 @@ class SubwayService:
         logger.info(f"Station ID set to: {self.station_id}")
         self._subscribers: List[Callable[[List[TrainArrival]], None]] = []
         self._update_thread: Optional[threading.Thread] = None
+        self._dispatch_thread: Optional[threading.Thread] = None
+        # Hand-off queue between the poll thread and subscriber dispatch;
+        # maxsize=1 with drop-and-replace keeps only the newest update
+        self._out_q: queue.Queue = queue.Queue(maxsize=1)
         self._should_run = False
         self._current_trains: List[TrainArrival] = []
+        # Flat (ids, minutes) tuples for the top two trains - notification
+        # checks compare these instead of TrainArrival.__eq__
+        self._top_ids: tuple = ()
+        self._top_mins: tuple = ()
+        # Persistent pool so the two GTFS feeds fetch in parallel each poll
+        self._pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix='gtfs')
+        self._feed_cache: dict = {}  # line -> (feed, fetched_at)
     
     def subscribe(self, callback: Callable[[List[TrainArrival]], None]):
         """Subscribe to train updates"""
@@ -49,29 +91,41 @@ class SubwayService:
         self._update_thread = threading.Thread(target=self._update_loop, args=(interval_seconds,))
         self._update_thread.daemon = True
         self._update_thread.start()
+        self._dispatch_thread = threading.Thread(target=self._dispatch_loop)
+        self._dispatch_thread.daemon = True
+        self._dispatch_thread.start()
         logger.info(f"Started subway update thread with {interval_seconds}s interval")
-    
+
     def stop_updates(self):
         """Stop periodic updates"""
         self._should_run = False
         if self._update_thread:
             self._update_thread.join()
             self._update_thread = None
+        if self._dispatch_thread:
+            self._dispatch_thread.join()
+            self._dispatch_thread = None
         logger.info("Stopped subway updates")
+
+    def _dispatch_loop(self):
+        """Deliver updates to subscribers off the poll thread, so a slow
+        display refresh can't delay the next GTFS fetch"""
+        while self._should_run:
+            try:
+                trains = self._out_q.get(timeout=1)
+            except queue.Empty:
+                continue
+            self._notify_subscribers(trains)
     
     def _should_notify(self, new_trains: List[TrainArrival]) -> bool:
         """Determine if we should notify subscribers based on changes"""
         if not self._current_trains or not new_trains:
             return True
-            
+
         # Always notify if first or second train changed
-        for i in range(min(2, len(new_trains))):
-            if i >= len(self._current_trains):
-                return True
-            if new_trains[i] != self._current_trains[i]:
-                return True
-        
-        return False
+        new_ids, new_mins = top_train_fields(new_trains)
+        n = len(new_ids)
+        return (new_ids, new_mins) != (self._top_ids[:n], self._top_mins[:n])
     
     def _update_loop(self, interval_seconds: int):
         """Background update loop"""
@@ -80,7 +134,13 @@ class SubwayService:
                 new_trains = self.get_upcoming_trains()
                 if self._should_notify(new_trains):
                     self._current_trains = new_trains
-                    self._notify_subscribers(new_trains)
+                    self._top_ids, self._top_mins = top_train_fields(new_trains)
+                    # Coalesce: replace any undelivered update with the newest
+                    try:
+                        self._out_q.get_nowait()
+                    except queue.Empty:
+                        pass
+                    self._out_q.put(new_trains)
                 time.sleep(interval_seconds)
             except Exception as e:
                 logger.error(f"Error in update loop: {str(e)}")
@@ -94,47 +154,76 @@ class SubwayService:
             except Exception as e:
                 logger.error(f"Error notifying subscriber: {str(e)}")
     
+    def _get_feed(self, line: str) -> NYCTFeed:
+        """Return the feed for a line, reusing it within FEED_TTL_SECONDS.
+
+        Stale feeds are refreshed in place via NYCTFeed.refresh() rather
+        than reconstructed, which reuses the feed object (and its session)
+        instead of rebuilding it from scratch every poll.
+        """
+        cached = self._feed_cache.get(line)
+        now = time.monotonic()
+        if cached:
+            feed, fetched_at = cached
+            if now - fetched_at < FEED_TTL_SECONDS:
+                return feed
+            feed.refresh()
+            self._feed_cache[line] = (feed, now)
+            return feed
+        feed = NYCTFeed(line)
+        self._feed_cache[line] = (feed, now)
+        return feed
+
     def get_upcoming_trains(self) -> List[TrainArrival]:
         """Get list of upcoming trains for the configured station"""
         try:
-            logger.debug(f"Fetching train data for station {self.station_id}")
-            
+            logger.debug("Fetching train data for station %s", self.station_id)
+
             # Fetch trains for the first line
-            logger.debug(f"Creating feed for line {config.TRAIN_LINE_1}")
-            feed_f = NYCTFeed(config.TRAIN_LINE_1)
-            logger.debug(f"Raw feed data for {config.TRAIN_LINE_1}: {feed_f}")
-            # Debug: Print all unique station IDs in the feed
-            station_ids = set()
-            for trip in feed_f.trips:
-                for stop in trip.stop_time_updates:
-                    station_ids.add(stop.stop_id)
-            logger.debug(f"Available station IDs in {config.TRAIN_LINE_1} feed: {sorted(list(station_ids))}")
-            
+            debug_enabled = logger.isEnabledFor(logging.DEBUG)
+
+            # Kick off both feed fetches concurrently; each does a blocking
+            # HTTP GET + protobuf parse, so wall time is the slower of the
+            # two instead of their sum
+            logger.debug("Creating feeds for lines %s and %s", config.TRAIN_LINE_1, config.TRAIN_LINE_2)
+            future_f = self._pool.submit(self._get_feed, config.TRAIN_LINE_1)
+            future_g = self._pool.submit(self._get_feed, config.TRAIN_LINE_2)
+
+            feed_f = future_f.result()
+            if debug_enabled:
+                logger.debug("Raw feed data for %s: %s", config.TRAIN_LINE_1, feed_f)
+                # Debug: Print all unique station IDs in the feed - this is an
+                # O(trips x stops) scan, so only pay for it at DEBUG level
+                station_ids = set()
+                for trip in feed_f.trips:
+                    for stop in trip.stop_time_updates:
+                        station_ids.add(stop.stop_id)
+                logger.debug("Available station IDs in %s feed: %s", config.TRAIN_LINE_1, sorted(station_ids))
+
             trains_f = feed_f.filter_trips(headed_for_stop_id=self.station_id)
-            logger.info(f"Found {len(trains_f)} trains for line {config.TRAIN_LINE_1}")
-            if not trains_f:
+            logger.info("Found %d trains for line %s", len(trains_f), config.TRAIN_LINE_1)
+            if not trains_f and debug_enabled:
                 logger.debug("No trains found for line F, checking feed status...")
-                logger.debug(f"Feed timestamp: {feed_f.timestamp if hasattr(feed_f, 'timestamp') else 'No timestamp'}")
-                logger.debug(f"Total trips in feed: {len(feed_f.trips) if hasattr(feed_f, 'trips') else 'No trips attribute'}")
+                logger.debug("Feed timestamp: %s", getattr(feed_f, 'timestamp', 'No timestamp'))
+                logger.debug("Total trips in feed: %s", len(feed_f.trips) if hasattr(feed_f, 'trips') else 'No trips attribute')
             
             # Fetch trains for the second line
-            logger.debug(f"Creating feed for line {config.TRAIN_LINE_2}")
-            feed_g = NYCTFeed(config.TRAIN_LINE_2)
-            logger.debug(f"Raw feed data for {config.TRAIN_LINE_2}: {feed_g}")
-            
-            # Debug: Print all unique station IDs in the feed
-            station_ids = set()
-            for trip in feed_g.trips:
-                for stop in trip.stop_time_updates:
-                    station_ids.add(stop.stop_id)
-            logger.debug(f"Available station IDs in {config.TRAIN_LINE_2} feed: {sorted(list(station_ids))}")
-            
+            feed_g = future_g.result()
+            if debug_enabled:
+                logger.debug("Raw feed data for %s: %s", config.TRAIN_LINE_2, feed_g)
+                # Debug: Print all unique station IDs in the feed
+                station_ids = set()
+                for trip in feed_g.trips:
+                    for stop in trip.stop_time_updates:
+                        station_ids.add(stop.stop_id)
+                logger.debug("Available station IDs in %s feed: %s", config.TRAIN_LINE_2, sorted(station_ids))
+
             trains_g = feed_g.filter_trips(headed_for_stop_id=self.station_id)
-            logger.info(f"Found {len(trains_g)} trains for line {config.TRAIN_LINE_2}")
-            if not trains_g:
+            logger.info("Found %d trains for line %s", len(trains_g), config.TRAIN_LINE_2)
+            if not trains_g and debug_enabled:
                 logger.debug("No trains found for line G, checking feed status...")
-                logger.debug(f"Feed timestamp: {feed_g.timestamp if hasattr(feed_g, 'timestamp') else 'No timestamp'}")
-                logger.debug(f"Total trips in feed: {len(feed_g.trips) if hasattr(feed_g, 'trips') else 'No trips attribute'}")
+                logger.debug("Feed timestamp: %s", getattr(feed_g, 'timestamp', 'No timestamp'))
+                logger.debug("Total trips in feed: %s", len(feed_g.trips) if hasattr(feed_g, 'trips') else 'No trips attribute')
             
             # Combine trains from both lines
             trains = trains_f + trains_g
@@ -144,34 +233,47 @@ class SubwayService:
                 return []
             
             arrivals = []
+            now = datetime.now()  # One clock read shared by every train
             for train in trains:
-                logger.debug(f"Processing train: {train.trip_id if hasattr(train, 'trip_id') else 'No trip_id'}")
-                arrival = self._process_train(train)
+                if debug_enabled:
+                    logger.debug("Processing train: %s", getattr(train, 'trip_id', 'No trip_id'))
+                arrival = self._process_train(train, now)
                 if arrival:
-                    logger.debug(f"Processed train arrival: {arrival.arrival_time} ({arrival.minutes_until_arrival} min)")
+                    if debug_enabled:
+                        logger.debug("Processed train arrival: %s (%d min)", arrival.arrival_time, arrival.minutes_until_arrival)
                     arrivals.append(arrival)
                 else:
                     logger.warning(f"Could not process train: {train}")
             
-            sorted_arrivals = sorted(arrivals, key=lambda x: x.minutes_until_arrival)
-            logger.info(f"Returning {len(sorted_arrivals)} processed train arrivals")
-            return sorted_arrivals
+            # In-place sort with attrgetter skips the list copy and the
+            # per-element lambda frame; the full ordering is still needed
+            # because the layout shows up to six trains per line
+            arrivals.sort(key=attrgetter('minutes_until_arrival'))
+            logger.info("Returning %d processed train arrivals", len(arrivals))
+            return arrivals
             
         except Exception as e:
             logger.error(f"Error getting subway data: {str(e)}", exc_info=True)
             return []
     
-    def _process_train(self, train: Trip) -> Optional[TrainArrival]:
+    def _process_train(self, train: Trip, now: datetime) -> Optional[TrainArrival]:
         """Process a single train and return its arrival information"""
         try:
-            logger.debug(f"Processing train with ID: {train.trip_id if hasattr(train, 'trip_id') else 'No trip_id'}")
-            logger.debug(f"Train stop updates: {train.stop_time_updates if hasattr(train, 'stop_time_updates') else 'No updates'}")
-            
-            target_stop = next((stop for stop in train.stop_time_updates 
-                              if stop.stop_id == self.station_id), None)
-            
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Processing train with ID: %s", getattr(train, 'trip_id', 'No trip_id'))
+                logger.debug("Train stop updates: %s", getattr(train, 'stop_time_updates', 'No updates'))
+
+            # Plain loop with a localized station id - no generator frame,
+            # and this runs for every train on every 5-second poll
+            target_stop = None
+            sid = self.station_id
+            for stop in train.stop_time_updates:
+                if stop.stop_id == sid:
+                    target_stop = stop
+                    break
+
             if not target_stop:
-                logger.debug(f"No target stop found for station {self.station_id}")
+                logger.debug("No target stop found for station %s", self.station_id)
                 return None
                 
             if not target_stop.arrival:
@@ -179,14 +281,13 @@ class SubwayService:
                 return None
             
             arrival_time = target_stop.arrival
-            now = datetime.now()
             minutes = max(0, round((arrival_time - now).total_seconds() / 60))
             
-            logger.debug(f"Calculated arrival: {minutes} minutes from now at {arrival_time}")
+            logger.debug("Calculated arrival: %d minutes from now at %s", minutes, arrival_time)
             
             return TrainArrival(
                 minutes_until_arrival=minutes,
-                arrival_time=arrival_time.strftime("%I:%M %p"),
+                arrival_time=_format_arrival(arrival_time),
                 train_id=train.trip_id,
                 route_id=train.route_id
             )
@@ -5,11 +5,13 @@ import logging
 from datetime import datetime
 
 def test_logging_setup():
-    log_file = 'log.txt'
-    
+    # Use a dedicated test log so running this never truncates the
+    # production log.txt or leaves its rotating handler disabled
+    log_file = 'test_log.txt'
+
     # Test 1: Direct file write
     try:
-        with open(log_file, 'w') as f:
+        with open(log_file, 'a') as f:
             f.write(f"Test write at {datetime.now()}\n")
         print(f"Successfully wrote to {log_file}")
     except Exception as e:
@@ -18,13 +20,12 @@ def test_logging_setup():
 
     # Test 2: Configure logging
     try:
+        file_handler = logging.FileHandler(log_file, mode='a')
+        stream_handler = logging.StreamHandler()
         logging.basicConfig(
             level=logging.DEBUG,
             format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(log_file, mode='a'),
-                logging.StreamHandler()
-            ],
+            handlers=[file_handler, stream_handler],
             force=True  # Override any existing logging config
         )
     except Exception as e:
@@ -36,7 +37,7 @@ def test_logging_setup():
     logger.debug("Debug test message")
     logger.info("Info test message")
     logger.warning("Warning test message")
-    
+
     # Test 4: Verify file contents
     try:
         with open(log_file, 'r') as f:
@@ -46,5 +47,9 @@ def test_logging_setup():
     except Exception as e:
         print(f"Error reading log file: {e}")
 
+    # Release the file handle so repeated runs don't leak descriptors
+    file_handler.close()
+    logging.getLogger().removeHandler(file_handler)
+
 if __name__ == "__main__":
-    test_logging_setup()
\ No newline at end of file
+    test_logging_setup()
@@ -1,4 +1,5 @@
 import os
+from functools import lru_cache
 from pathlib import Path
 from PIL import Image,ImageFont
 import requests
@@ -20,26 +21,66 @@ font36 = ImageFont.truetype(os.path.join(picdir, 'Font.ttc'), 36)
 imgdir = os.path.join(os.path.dirname(os.path.realpath(__file__)), 'img')
 svgdir = os.path.join(os.path.dirname(os.path.realpath(__file__)), 'weather_icons')
 
+# Shared session so repeated polls reuse the TCP+TLS connection instead of
+# re-handshaking every call; retries cover transient API hiccups
+_http = requests.Session()
+_http.mount("https://", requests.adapters.HTTPAdapter(
+    pool_connections=2, pool_maxsize=4,
+    max_retries=requests.adapters.Retry(total=3, backoff_factor=0.5)))
+
 def getWeather(key, days):
-    resp = requests.get("https://api.weatherapi.com/v1/forecast.json?key={}&q=11231&days={}&aqi=no&alerts=no".format(key, days))
+    resp = _http.get("https://api.weatherapi.com/v1/forecast.json?key={}&q=11231&days={}&aqi=no&alerts=no".format(key, days), timeout=(3, 10))
     logger.info("Received Weather")
     return resp.json()
 
 def getHeadlines(apiKey):
-    headlineJson = requests.get("https://newsapi.org/v2/top-headlines?country=us&apiKey={}".format(apiKey)).json()
+    headlineJson = _http.get("https://newsapi.org/v2/top-headlines?country=us&apiKey={}".format(apiKey), timeout=(3, 10)).json()
     logger.info("Received News")
     return headlineJson["articles"]
 
+async def fetchAll(key, newsKey, days):
+    """Fetch weather and headlines concurrently on one pooled async client.
+
+    Wall time becomes the slower of the two requests instead of their sum.
+    Call from sync code with asyncio.run(fetchAll(...)). httpx is imported
+    lazily so the display pipeline doesn't pay for it; it is NOT a declared
+    dependency, so `pip install httpx` (or `uv add httpx`) before calling
+    this - nothing in the display pipeline does.
+    """
+    import asyncio
+    import httpx
+
+    weather_url = "https://api.weatherapi.com/v1/forecast.json?key={}&q=11231&days={}&aqi=no&alerts=no".format(key, days)
+    news_url = "https://newsapi.org/v2/top-headlines?country=us&apiKey={}".format(newsKey)
+    async with httpx.AsyncClient(timeout=10.0) as client:
+        weather_resp, news_resp = await asyncio.gather(
+            client.get(weather_url), client.get(news_url))
+    logger.info("Received Weather and News")
+    return weather_resp.json(), news_resp.json()["articles"]
+
+@lru_cache(maxsize=256)
+def _rasterizeWeatherIcon(iconPath, size):
+    """Rasterize an SVG icon to PNG bytes, cached by (path, size).
+
+    There are only ~50 icons at a handful of sizes, so after warmup every
+    call skips the cairosvg parse+raster entirely. Bytes are cached rather
+    than PIL images so callers never share a mutable Image.
+    """
+    png_data = BytesIO()
+    cairosvg.svg2png(url=iconPath, write_to=png_data, parent_width=size, parent_height=size)
+    return png_data.getvalue()
+
 def getWeatherIcon(weatherReportJson, size):
     """Convert SVG weather icon to PNG and return as PIL Image without saving to disk"""
-    
+
     iconPath = getWeatherIconPath(weatherReportJson)
-    png_data = BytesIO()
-    
+
     try:
-        cairosvg.svg2png(url=iconPath, write_to=png_data, parent_width=size, parent_height=size)
-        png_data.seek(0)
-        return Image.open(png_data)
+        buf = BytesIO(_rasterizeWeatherIcon(iconPath, size))
+        img = Image.open(buf)
+        img.load()  # decode eagerly so the PNG buffer isn't retained
+        buf.close()
+        return img
     except Exception as e:
         logger.error(f"Error creating weather icon: {str(e)}")
         raise
@@ -49,82 +90,98 @@ def getWeatherIconPath(weatherReportJson):
     iconNum = mapWeatherCodeToWeatherIconDir(weatherReportJson["condition"]["code"])
     return getWeatherIconFromSVGs(iconNum, weatherReportJson.get("is_day"))
 
+_NA_ICON = os.path.join(svgdir, "Extra/wi-na.svg")
+
+def _buildIconIndex():
+    """Walk weather_icons once at import and map each icon dir to its day
+    and night SVG paths, so lookups skip the per-call os.listdir + scan"""
+    index = {}
+    if not os.path.isdir(svgdir):
+        return index
+    for entry in os.scandir(svgdir):
+        if not entry.is_dir():
+            continue
+        icons = [i for i in os.listdir(entry.path) if i != ".DS_Store"]
+        if len(icons) == 1:
+            # Single icon serves both day and night
+            only = os.path.join(entry.path, icons[0])
+            index[entry.name] = {"day": only, "night": only}
+            continue
+        day = next((i for i in icons if "night" not in i), None)
+        night = next((i for i in icons if "night" in i), None)
+        index[entry.name] = {
+            "day": os.path.join(entry.path, day) if day else _NA_ICON,
+            "night": os.path.join(entry.path, night) if night else _NA_ICON,
+        }
+    return index
+
+_ICON_INDEX = _buildIconIndex()
+
 def getWeatherIconFromSVGs(iconNum, dayNum):
-    weatherIconDir = os.path.join(svgdir, iconNum)
-    icons = os.listdir(weatherIconDir)
-    if dayNum == None:
-        dayNum = 1
-
-    if len(icons) == 1:
-        return os.path.join(weatherIconDir, icons[0])
-    else:
-        for icon in icons:
-            if icon == ".DS_Store":
-                # skip
-                logger.info("skip")
-            elif dayNum == 0 and icon.find("night") >= 0:
-                return os.path.join(weatherIconDir, icon)
-            elif dayNum == 1 and icon.find("night") == -1:
-                return os.path.join(weatherIconDir, icon)
-
-    return os.path.join(svgdir, "Extra/wi-na.svg")
+    entry = _ICON_INDEX.get(iconNum)
+    if entry is None:
+        return _NA_ICON
+    return entry["night"] if dayNum == 0 else entry["day"]
 
 def emptyImage():
     emptyImage = Image.new('1', (config.display.WIDTH, config.display.HEIGHT), 255)
     return emptyImage
 
+# WeatherAPI condition code -> weather_icons subdirectory, built once at
+# import instead of per call
+_WEATHER_CODE_TO_ICON_DIR = {
+    1000: "113",
+    1003: "116",
+    1006: "119",
+    1009: "122",
+    1030: "143",
+    1063: "176",
+    1066: "179",
+    1069: "182",
+    1072: "185",
+    1087: "200",
+    1114: "227",
+    1117: "230",
+    1135: "248",
+    1147: "260",
+    1150: "263",
+    1153: "266",
+    1168: "281",
+    1171: "284",
+    1180: "293",
+    1183: "296",
+    1186: "299",
+    1189: "302",
+    1192: "305",
+    1195: "308",
+    1198: "311",
+    1201: "314",
+    1204: "317",
+    1207: "320",
+    1210: "323",
+    1213: "326",
+    1216: "329",
+    1219: "332",
+    1222: "335",
+    1225: "338",
+    1237: "350",
+    1240: "353",
+    1243: "356",
+    1246: "359",
+    1249: "362",
+    1252: "365",
+    1255: "368",
+    1258: "371",
+    1261: "374",
+    1264: "377",
+    1273: "386",
+    1276: "389",
+    1279: "392",
+    1282: "395",
+}
+
 def mapWeatherCodeToWeatherIconDir(code):
-    switcher = {
-        1000: "113",
-        1003: "116",
-        1006: "119",
-        1009: "122",
-        1030: "143",
-        1063: "176",
-        1066: "179",
-        1069: "182",
-        1072: "185",
-        1087: "200",
-        1114: "227",
-        1117: "230",
-        1135: "248",
-        1147: "260",
-        1150: "263",
-        1153: "266",
-        1168: "281",
-        1171: "284",
-        1180: "293",
-        1183: "296",
-        1186: "299",
-        1189: "302",
-        1192: "305",
-        1195: "308",
-        1198: "311",
-        1201: "314",
-        1204: "317",
-        1207: "320",
-        1210: "323",
-        1213: "326",
-        1216: "329",
-        1219: "332",
-        1222: "335",
-        1225: "338",
-        1237: "350",
-        1240: "353",
-        1243: "356",
-        1246: "359",
-        1249: "362",
-        1252: "365",
-        1255: "368",
-        1258: "371",
-        1261: "374",
-        1264: "377",
-        1273: "386",
-        1276: "389",
-        1279: "392",
-        1282: "395",
-    }
-    return switcher.get(code)
+    return _WEATHER_CODE_TO_ICON_DIR.get(code)
 
 def shortenWeatherText(desc):
     desc = desc.replace("with", "w/")
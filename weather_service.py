@@ -1,26 +1,219 @@
+import bisect
 import logging
+import os
 from typing import Dict, Callable, List
 import threading
+import queue
 import time
+import numpy as np
 import requests
 from config import config
 from datetime import datetime, timedelta
-import pytz
+from types import MappingProxyType
+from urllib.parse import urlencode
+from zoneinfo import ZoneInfo
 
 logger = logging.getLogger(__name__)
 
+# orjson is several times faster than stdlib json on the float-heavy
+# Open-Meteo arrays; fall back to stdlib json when it isn't installed
+try:
+    import orjson
+
+    def _json_loads(data):
+        return orjson.loads(data)
+
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    import json
+
+    def _json_loads(data):
+        return json.loads(data)
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+# Single shared timezone instance; zoneinfo interns the zone data so this
+# is allocation-free after import, unlike repeated pytz.timezone() lookups
+NY_TZ = ZoneInfo('America/New_York')
+
+# Open-Meteo only regenerates forecasts every ~15 minutes, so responses
+# younger than this are served from the on-disk cache without a fetch
+CACHE_TTL_SECONDS = 900
+_CACHE_PATH = os.path.expanduser('~/.cache/weather_service.json')
+
+# WMO weather code lookups, built once at module scope - these run for all
+# 72 hourly entries on every fetch, so per-call dict literals added up
+_WMO_TO_WAPI = {
+    0: 1000,  # Clear sky
+    1: 1003,  # Mainly clear
+    2: 1003,  # Partly cloudy
+    3: 1006,  # Overcast
+    45: 1135,  # Foggy
+    48: 1147,  # Depositing rime fog
+    51: 1150,  # Light drizzle
+    53: 1153,  # Moderate drizzle
+    55: 1153,  # Dense drizzle
+    61: 1180,  # Slight rain
+    63: 1183,  # Moderate rain
+    65: 1186,  # Heavy rain
+    71: 1210,  # Slight snow
+    73: 1213,  # Moderate snow
+    75: 1216,  # Heavy snow
+    77: 1255,  # Snow grains
+    80: 1240,  # Slight rain showers
+    81: 1243,  # Moderate rain showers
+    82: 1246,  # Violent rain showers
+    85: 1255,  # Slight snow showers
+    86: 1258,  # Heavy snow showers
+    95: 1273,  # Thunderstorm
+    96: 1276,  # Thunderstorm with slight hail
+    99: 1279   # Thunderstorm with heavy hail
+}
+
+_WMO_TO_TEXT = {
+    0: "Clear",
+    1: "Mainly clear",
+    2: "Partly cloudy",
+    3: "Overcast",
+    45: "Foggy",
+    48: "Rime fog",
+    51: "Light drizzle",
+    53: "Moderate drizzle",
+    55: "Dense drizzle",
+    61: "Light rain",
+    63: "Moderate rain",
+    65: "Heavy rain",
+    71: "Light snow",
+    73: "Moderate snow",
+    75: "Heavy snow",
+    77: "Snow grains",
+    80: "Light rain showers",
+    81: "Moderate rain showers",
+    82: "Violent rain showers",
+    85: "Light snow showers",
+    86: "Heavy snow showers",
+    95: "Thunderstorm",
+    96: "Thunderstorm with hail",
+    99: "Thunderstorm with heavy hail"
+}
+
+def _freeze(obj):
+    """Recursively wrap dicts read-only (lists become tuples).
+
+    Every subscriber receives the same frozen snapshot, so one callback
+    mutating the delivered dict can no longer corrupt what the others
+    see - without paying for a deepcopy per subscriber.
+    """
+    if isinstance(obj, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in obj.items()})
+    if isinstance(obj, list):
+        return tuple(_freeze(v) for v in obj)
+    return obj
+
+
+class _HourlyView:
+    """Columnar view over the Open-Meteo hourly arrays.
+
+    Bundles the parsed timestamps and NumPy columns, built once per
+    response and cached on the data dict, so every consumer shares one
+    set of arrays instead of deriving its own. The raw dict-of-lists
+    stays at weather_data['hourly'] for compatibility.
+    """
+
+    __slots__ = ('times', 'parsed', 'dates', 'tods',
+                 'temps', 'precip', 'wind', 'codes', 'is_day')
+
+    def __init__(self, hourly: Dict):
+        self.times = hourly['time']
+        self.parsed = [datetime.fromisoformat(t) for t in self.times]
+        self.dates = [dt.date() for dt in self.parsed]
+        self.tods = [dt.time() for dt in self.parsed]
+        self.temps = np.asarray(hourly['temperature_2m'], dtype=np.float64)
+        self.precip = np.asarray(hourly['precipitation_probability'], dtype=np.float64)
+        self.wind = np.asarray(hourly['windspeed_10m'], dtype=np.float64)
+        self.codes = hourly['weathercode']
+        self.is_day = hourly['is_day']
+
+
+class _LazyDayForecast(dict):
+    """Day forecast dict whose 'hour' list is built on first access.
+
+    The display never reads the per-day hourly dicts, so eagerly building
+    24 of them per day on every rebuild was pure overhead; ['hour'] still
+    works for any caller that wants it.
+    """
+
+    def __init__(self, service: "WeatherService", data: Dict, day_index: int, **fields):
+        super().__init__(**fields)
+        self._service = service
+        self._data = data
+        self._day_index = day_index
+
+    def __missing__(self, key):
+        if key == 'hour':
+            hours = self._service._get_hourly_data_for_day(self._data, self._day_index)
+            self['hour'] = hours
+            return hours
+        raise KeyError(key)
+
+
 class WeatherService:
     def __init__(self):
         self._subscribers: List[Callable[[Dict], None]] = []
         self._update_thread: threading.Thread | None = None
+        self._dispatch_thread: threading.Thread | None = None
+        # Hand-off queue so slow subscribers (the e-ink render) run on
+        # their own thread and can't delay the next fetch; bounded with
+        # drop-oldest so a stalled display only ever sees recent data
+        self._cb_queue: queue.Queue = queue.Queue(maxsize=4)
         self._should_run = False
         self._current_data: Dict | None = None
-    
+        self._current_sig: int | None = None
+        # Derived lists memoized on the first hourly timestamp (the data's
+        # version anchor) so unchanged upstream data skips the rebuild
+        self._forecast_cache: tuple | None = None  # (anchor, forecastday list)
+        self._commute_cache: tuple | None = None   # ((anchor, hour), forecasts)
+        # Wakes the update loop early when a subscriber arrives or at shutdown
+        self._wake = threading.Event()
+        # One keep-alive connection to Open-Meteo reused across polls, so
+        # each 5-minute fetch skips the TCP+TLS handshake
+        self._session = requests.Session()
+        self._session.headers['Accept-Encoding'] = 'gzip'
+        self._session.mount("https://", requests.adapters.HTTPAdapter(
+            pool_connections=1, pool_maxsize=1))
+        # Static part of the Open-Meteo query, encoded once; only the
+        # start_hour/end_hour window varies per poll
+        lat, lon = config.WEATHER_COORDS
+        self._base_url = "https://api.open-meteo.com/v1/forecast?" + urlencode([
+            ("latitude", lat),
+            ("longitude", lon),
+            ("hourly", [
+                "temperature_2m",
+                "precipitation_probability",
+                "weathercode",
+                "windspeed_10m",
+                "is_day"
+            ]),
+            ("daily", [
+                "weathercode",
+                "temperature_2m_max",
+                "temperature_2m_min",
+                "precipitation_probability_max"
+            ]),
+            ("timezone", "America/New_York"),
+            ("temperature_unit", "fahrenheit"),
+            ("windspeed_unit", "mph"),
+            ("forecast_days", 3),
+        ], doseq=True)
+
     def subscribe(self, callback: Callable[[Dict], None]):
         """Subscribe to weather updates"""
         self._subscribers.append(callback)
         if self._current_data:  # Send current data to new subscriber
             callback(self._current_data)
+        self._wake.set()
     
     def start_updates(self, interval_seconds: int = 300):  # Default 5 minutes
         """Start periodic updates"""
@@ -32,64 +225,138 @@ class WeatherService:
         self._update_thread = threading.Thread(target=self._update_loop, args=(interval_seconds,))
         self._update_thread.daemon = True
         self._update_thread.start()
+        self._dispatch_thread = threading.Thread(target=self._dispatch_loop)
+        self._dispatch_thread.daemon = True
+        self._dispatch_thread.start()
         logger.info(f"Started weather update thread with {interval_seconds}s interval")
     
     def stop_updates(self):
         """Stop periodic updates"""
         self._should_run = False
+        self._wake.set()  # Unblock the loop so shutdown doesn't wait a cycle
         if self._update_thread:
             self._update_thread.join()
             self._update_thread = None
+        if self._dispatch_thread:
+            self._dispatch_thread.join()
+            self._dispatch_thread = None
         logger.info("Stopped weather updates")
 
     def _update_loop(self, interval_seconds: int):
         """Background update loop"""
+        # Monotonic deadline: interval_seconds is the period between fetch
+        # starts, so fetch+parse+notify time no longer drifts the cadence
+        next_t = time.monotonic()
         while self._should_run:
-            try:
-                weather_data = self.get_weather()
-                if weather_data != self._current_data:  # Only notify if data changed
-                    self._current_data = weather_data
-                    self._notify_subscribers(weather_data)
-                time.sleep(interval_seconds)
-            except Exception as e:
-                logger.error(f"Error in weather update loop: {str(e)}")
-                time.sleep(interval_seconds)
+            # Gatekeeper: with no subscribers there's nothing to do, so skip
+            # the fetch (and its network/parse cost) entirely
+            if self._subscribers:
+                try:
+                    weather_data = self.get_weather()
+                    sig = self._signature(weather_data)
+                    if sig != self._current_sig:  # Only notify if data changed
+                        self._current_sig = sig
+                        # (_current_data is already set by get_weather)
+                        # Drop the oldest undelivered update if the queue is full
+                        try:
+                            self._cb_queue.put_nowait(weather_data)
+                        except queue.Full:
+                            try:
+                                self._cb_queue.get_nowait()
+                            except queue.Empty:
+                                pass
+                            self._cb_queue.put_nowait(weather_data)
+                except Exception as e:
+                    logger.error(f"Error in weather update loop: {str(e)}")
+            # Sleep until the next deadline; an early wake (new subscriber
+            # or shutdown) re-anchors the schedule to now
+            next_t += interval_seconds
+            if self._wake.wait(max(0, next_t - time.monotonic())):
+                next_t = time.monotonic()
+            self._wake.clear()
     
+    @staticmethod
+    def _signature(weather_data: Dict) -> int:
+        """Single hash over the fields that drive the display.
+
+        Comparing one integer replaces the previous deep dict compare,
+        and no-op float noise in fields the display never reads no longer
+        triggers re-renders. The hourly columns the 12-hour lane renders
+        are folded in so a mid-hour refetch that revises future temps or
+        icons still notifies subscribers.
+        """
+        cur = weather_data['current']
+        hourly = weather_data['hourly']
+        return hash((cur['temp_f'], cur['condition']['code'], cur['wind_mph'],
+                     cur['precip_chance'], hourly['time'][0],
+                     tuple(hourly['temperature_2m']),
+                     tuple(hourly['weathercode']),
+                     tuple(hourly['precipitation_probability']),
+                     tuple(hourly['is_day'])))
+
+    def _dispatch_loop(self):
+        """Deliver updates to subscribers off the update thread, so a slow
+        display refresh can't delay the next weather fetch"""
+        while self._should_run:
+            try:
+                weather_data = self._cb_queue.get(timeout=1)
+            except queue.Empty:
+                continue
+            self._notify_subscribers(weather_data)
+
     def _notify_subscribers(self, weather_data: Dict):
-        """Notify all subscribers of new weather data"""
+        """Notify all subscribers of new weather data (as a read-only snapshot)"""
+        snapshot = _freeze(weather_data)
         for subscriber in self._subscribers:
             try:
-                subscriber(weather_data)
+                subscriber(snapshot)
             except Exception as e:
                 logger.error(f"Error notifying weather subscriber: {str(e)}")
 
+    @staticmethod
+    def _hourly_view(data: Dict) -> _HourlyView:
+        """Return the columnar view for a response, building it on first use"""
+        view = data.get('_hourly_view')
+        if view is None:
+            view = data['_hourly_view'] = _HourlyView(data['hourly'])
+        return view
+
     def _get_commute_forecasts(self, weather_data: Dict) -> List[Dict]:
         """Extract weather forecasts for commute periods"""
         forecasts = []
-        ny_tz = pytz.timezone('America/New_York')
-        now = datetime.now(ny_tz)
+        now = datetime.now(NY_TZ)
         
         logger.debug("Starting commute forecast generation")
         logger.debug(f"Daily data structure: {weather_data.get('daily', {}).keys()}")
-        
+
+        # Shared columnar view: parsed timestamps plus NumPy columns, built
+        # once per response (the API is already in America/New_York, so no
+        # astimezone is needed)
+        view = self._hourly_view(weather_data)
+
+        # Index built in get_weather; fall back for callers passing raw data
+        daily_idx = weather_data.get('_daily_idx')
+        if daily_idx is None:
+            daily_idx = {t: i for i, t in enumerate(weather_data.get('daily', {}).get('time', []))}
+
         # Process each commute period for today and tomorrow
         for day_offset in [0, 1]:  # 0 for today, 1 for tomorrow
             target_date = now.date() + timedelta(days=day_offset)
             logger.debug(f"Processing forecasts for date: {target_date}")
             
             # Find the index for this date in the daily data
-            try:
-                date_str = target_date.strftime('%Y-%m-%d')
-                day_index = weather_data['daily']['time'].index(date_str)
-                logger.debug(f"Found date {date_str} at index {day_index}")
-            except (ValueError, KeyError) as e:
-                logger.warning(f"Could not find date {date_str} in daily data: {e}")
+            date_str = target_date.strftime('%Y-%m-%d')
+            day_index = daily_idx.get(date_str)
+            if day_index is None:
+                logger.warning(f"Could not find date {date_str} in daily data")
                 continue
+            logger.debug(f"Found date {date_str} at index {day_index}")
             
             # Process each commute period for this day
             for period, times in config.commute_times.items():
-                start_time = datetime.strptime(times['start'], '%H:%M').time()
-                end_time = datetime.strptime(times['end'], '%H:%M').time()
+                parsed_times = config.commute_times_parsed[period]
+                start_time = parsed_times['start']
+                end_time = parsed_times['end']
                 
                 # Skip if we're past this period today
                 if day_offset == 0 and now.time() > end_time:
@@ -97,27 +364,22 @@ class WeatherService:
                     continue
                 
                 # Find relevant hourly forecasts for this period
-                period_indices = []
-                for i, timestamp in enumerate(weather_data['hourly']['time']):
-                    dt = datetime.fromisoformat(timestamp).astimezone(ny_tz)
-                    if dt.date() == target_date and start_time <= dt.time() <= end_time:
-                        period_indices.append(i)
+                period_indices = [
+                    i for i, d in enumerate(view.dates)
+                    if d == target_date and start_time <= view.tods[i] <= end_time
+                ]
                 
                 if period_indices:
                     logger.debug(f"Found {len(period_indices)} hourly forecasts for period {period}")
-                    
+
                     # Calculate averages for the period
-                    temps = [weather_data['hourly']['temperature_2m'][i] for i in period_indices]
-                    precip_probs = [weather_data['hourly']['precipitation_probability'][i] for i in period_indices]
-                    wind_speeds = [weather_data['hourly']['windspeed_10m'][i] for i in period_indices]
-                    weather_codes = [weather_data['hourly']['weathercode'][i] for i in period_indices]
-                    
-                    avg_temp = sum(temps) / len(temps)
-                    max_precip = max(precip_probs)
-                    avg_wind = sum(wind_speeds) / len(wind_speeds)
-                    
+                    idx = np.asarray(period_indices, dtype=np.intp)
+                    avg_temp = float(view.temps[idx].mean())
+                    max_precip = float(view.precip[idx].max())
+                    avg_wind = float(view.wind[idx].mean())
+
                     # Use middle period weather code for conditions
-                    mid_code = weather_codes[len(weather_codes)//2]
+                    mid_code = view.codes[period_indices[len(period_indices)//2]]
                     
                     forecasts.append({
                         'period': times['label'],
@@ -134,66 +396,35 @@ class WeatherService:
         
         return forecasts
 
-    def _map_condition_code(self, wmo_code: int) -> int:
+    @staticmethod
+    def _map_condition_code(wmo_code: int) -> int:
         """Map WMO weather codes to WeatherAPI condition codes"""
-        # Mapping of WMO codes to WeatherAPI codes
-        code_map = {
-            0: 1000,  # Clear sky
-            1: 1003,  # Mainly clear
-            2: 1003,  # Partly cloudy
-            3: 1006,  # Overcast
-            45: 1135,  # Foggy
-            48: 1147,  # Depositing rime fog
-            51: 1150,  # Light drizzle
-            53: 1153,  # Moderate drizzle
-            55: 1153,  # Dense drizzle
-            61: 1180,  # Slight rain
-            63: 1183,  # Moderate rain
-            65: 1186,  # Heavy rain
-            71: 1210,  # Slight snow
-            73: 1213,  # Moderate snow
-            75: 1216,  # Heavy snow
-            77: 1255,  # Snow grains
-            80: 1240,  # Slight rain showers
-            81: 1243,  # Moderate rain showers
-            82: 1246,  # Violent rain showers
-            85: 1255,  # Slight snow showers
-            86: 1258,  # Heavy snow showers
-            95: 1273,  # Thunderstorm
-            96: 1276,  # Thunderstorm with slight hail
-            99: 1279   # Thunderstorm with heavy hail
-        }
-        return code_map.get(wmo_code, 1000)  # Default to clear sky if code not found
-
-    def _get_condition_text(self, wmo_code: int) -> str:
+        return _WMO_TO_WAPI.get(wmo_code, 1000)  # Default to clear sky if code not found
+
+    @staticmethod
+    def _get_condition_text(wmo_code: int) -> str:
         """Convert WMO weather code to readable condition text"""
-        conditions = {
-            0: "Clear",
-            1: "Mainly clear",
-            2: "Partly cloudy",
-            3: "Overcast",
-            45: "Foggy",
-            48: "Rime fog",
-            51: "Light drizzle",
-            53: "Moderate drizzle",
-            55: "Dense drizzle",
-            61: "Light rain",
-            63: "Moderate rain",
-            65: "Heavy rain",
-            71: "Light snow",
-            73: "Moderate snow",
-            75: "Heavy snow",
-            77: "Snow grains",
-            80: "Light rain showers",
-            81: "Moderate rain showers",
-            82: "Violent rain showers",
-            85: "Light snow showers",
-            86: "Heavy snow showers",
-            95: "Thunderstorm",
-            96: "Thunderstorm with hail",
-            99: "Thunderstorm with heavy hail"
-        }
-        return conditions.get(wmo_code, "Clear")
+        return _WMO_TO_TEXT.get(wmo_code, "Clear")
+
+    @staticmethod
+    def _load_cached_response() -> tuple:
+        """Return (data, fetched_at) from the on-disk cache, or (None, 0)"""
+        try:
+            with open(_CACHE_PATH, 'rb') as f:
+                cached = _json_loads(f.read())
+            return cached['data'], cached['fetched_at']
+        except (OSError, ValueError, KeyError):
+            return None, 0
+
+    @staticmethod
+    def _store_cached_response(data: Dict):
+        """Persist the raw API response so restarts and outages reuse it"""
+        try:
+            os.makedirs(os.path.dirname(_CACHE_PATH), exist_ok=True)
+            with open(_CACHE_PATH, 'wb') as f:
+                f.write(_json_dumps({'fetched_at': time.time(), 'data': data}))
+        except OSError as e:
+            logger.warning(f"Could not write weather cache: {e}")
 
     def get_weather(self) -> Dict:
         """Fetch current weather data and add commute forecasts"""
@@ -201,50 +432,76 @@ class WeatherService:
             # Get coordinates from config
             lat, lon = config.WEATHER_COORDS
             logger.info(f"Fetching weather for coordinates: {lat}, {lon}")
-            
-            # Construct Open-Meteo API URL
-            url = "https://api.open-meteo.com/v1/forecast"
-            params = {
-                "latitude": lat,
-                "longitude": lon,
-                "hourly": [
-                    "temperature_2m",
-                    "precipitation_probability",
-                    "weathercode",
-                    "windspeed_10m",
-                    "is_day"
-                ],
-                "daily": [
-                    "weathercode",
-                    "temperature_2m_max",
-                    "temperature_2m_min",
-                    "precipitation_probability_max"
-                ],
-                "timezone": "America/New_York",
-                "temperature_unit": "fahrenheit",
-                "windspeed_unit": "mph",
-                "forecast_days": 3
-            }
-            
-            logger.debug(f"Making API request to: {url}")
-            logger.debug(f"With parameters: {params}")
-            
-            response = requests.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
+
+            # Only ask for the hours we actually consume: the current hour
+            # through tomorrow's last commute period, ~20 hourly rows of
+            # JSON to download and decode instead of 72
+            now = datetime.now(NY_TZ)
+            last_commute_hour = max(
+                t['end'].hour for t in config.commute_times_parsed.values())
+            start_hour = now.strftime('%Y-%m-%dT%H:00')
+            end_hour = (now + timedelta(days=1)).replace(
+                hour=last_commute_hour, minute=0).strftime('%Y-%m-%dT%H:00')
+
+            # Pre-encoded static query plus the per-poll hour window
+            url = self._base_url + '&' + urlencode(
+                {"start_hour": start_hour, "end_hour": end_hour})
+
+            # Serve from the on-disk cache while it's fresh; on a failed
+            # fetch, a stale cached copy is still better than raising
+            cached_data, fetched_at = self._load_cached_response()
+            if cached_data is not None and time.time() - fetched_at < CACHE_TTL_SECONDS:
+                logger.debug("Using cached weather data (%.0fs old)", time.time() - fetched_at)
+                data = cached_data
+            else:
+                logger.debug(f"Making API request to: {url}")
+                try:
+                    response = self._session.get(url, timeout=10)
+                    response.raise_for_status()
+                    data = _json_loads(response.content)
+                    self._store_cached_response(data)
+                except Exception as e:
+                    if cached_data is None:
+                        raise
+                    logger.warning(f"Weather fetch failed ({e}), falling back to cached copy")
+                    data = cached_data
+            # Attach timestamp -> index lookups so downstream code does dict
+            # gets instead of repeated linear list.index() scans
+            data['_hourly_idx'] = {t: i for i, t in enumerate(data['hourly']['time'])}
+            data['_daily_idx'] = {t: i for i, t in enumerate(data['daily']['time'])}
+
+            # Reuse the materialized forecast/commute lists while the data's
+            # anchor timestamp is unchanged; the commute key also carries the
+            # wall-clock hour since past periods get filtered out over time
+            anchor = data['hourly']['time'][0]
+            if self._forecast_cache and self._forecast_cache[0] == anchor:
+                forecast_days = self._forecast_cache[1]
+            else:
+                forecast_days = self._get_forecast_days(data)
+                self._forecast_cache = (anchor, forecast_days)
+
+            commute_key = (anchor,
+                           datetime.now(NY_TZ).strftime('%Y-%m-%dT%H'))
+            if self._commute_cache and self._commute_cache[0] == commute_key:
+                commute_forecasts = self._commute_cache[1]
+            else:
+                commute_forecasts = self._get_commute_forecasts(data)
+                self._commute_cache = (commute_key, commute_forecasts)
+
             # Transform the data to match our expected format
             weather_data = {
                 'current': self._get_current_conditions(data),
                 'forecast': {
-                    'forecastday': self._get_forecast_days(data)
+                    'forecastday': forecast_days
                 },
                 'hourly': data['hourly'],
-                'commute_forecasts': self._get_commute_forecasts(data)
+                'commute_forecasts': commute_forecasts
             }
             
-            # Store the full response for later use
-            self._current_data = data
-            
+            # Store the transformed data for later use - get_next_commutes
+            # and late subscribers both expect this shape
+            self._current_data = weather_data
+
             return weather_data
             
         except Exception as e:
@@ -256,34 +513,37 @@ class WeatherService:
         """Extract current conditions from Open-Meteo data"""
         try:
             # Find the index for the current hour
-            ny_tz = pytz.timezone('America/New_York')
-            now = datetime.now(ny_tz)
+            now = datetime.now(NY_TZ)
             current_time = now.strftime('%Y-%m-%dT%H:00')
             
             logger.debug(f"Looking for current time: {current_time}")
             logger.debug(f"Available times: {data.get('hourly', {}).get('time', [])[:5]}")
             
-            try:
-                current_idx = data['hourly']['time'].index(current_time)
-                logger.debug(f"Found current time at index: {current_idx}")
-            except ValueError:
+            hourly_idx = data.get('_hourly_idx')
+            if hourly_idx is None:
+                hourly_idx = {t: i for i, t in enumerate(data['hourly']['time'])}
+            current_idx = hourly_idx.get(current_time)
+            if current_idx is None:
                 logger.warning(f"Could not find exact time {current_time} in hourly data, using first available hour")
                 current_idx = 0
+            else:
+                logger.debug(f"Found current time at index: {current_idx}")
             
             # Log the data we're trying to access
-            logger.debug(f"Temperature data type: {type(data['hourly']['temperature_2m'])}")
-            logger.debug(f"Temperature data length: {len(data['hourly']['temperature_2m'])}")
+            view = self._hourly_view(data)
+            logger.debug(f"Temperature data length: {len(view.temps)}")
             logger.debug(f"Current index: {current_idx}")
-            
+
+            code = view.codes[current_idx]
             conditions = {
-                'temp_f': data['hourly']['temperature_2m'][current_idx],
+                'temp_f': float(view.temps[current_idx]),
                 'condition': {
-                    'text': self._get_condition_text(data['hourly']['weathercode'][current_idx]),
-                    'code': self._map_condition_code(data['hourly']['weathercode'][current_idx])
+                    'text': self._get_condition_text(code),
+                    'code': self._map_condition_code(code)
                 },
-                'wind_mph': data['hourly']['windspeed_10m'][current_idx],
-                'precip_chance': data['hourly']['precipitation_probability'][current_idx],
-                'is_day': data['hourly']['is_day'][current_idx]
+                'wind_mph': float(view.wind[current_idx]),
+                'precip_chance': float(view.precip[current_idx]),
+                'is_day': view.is_day[current_idx]
             }
             
             logger.debug(f"Generated current conditions: {conditions}")
@@ -299,9 +559,10 @@ class WeatherService:
         """Transform daily forecast data to match expected format"""
         forecasts = []
         for i in range(len(data['daily']['time'])):
-            forecasts.append({
-                'date': data['daily']['time'][i],
-                'day': {
+            forecasts.append(_LazyDayForecast(
+                self, data, i,
+                date=data['daily']['time'][i],
+                day={
                     'maxtemp_f': data['daily']['temperature_2m_max'][i],
                     'mintemp_f': data['daily']['temperature_2m_min'][i],
                     'daily_chance_of_rain': data['daily']['precipitation_probability_max'][i],
@@ -309,18 +570,21 @@ class WeatherService:
                         'text': self._get_condition_text(data['daily']['weathercode'][i]),
                         'code': self._map_condition_code(data['daily']['weathercode'][i])
                     }
-                },
-                'hour': self._get_hourly_data_for_day(data, i)
-            })
+                }
+                # 'hour' is filled in lazily by _LazyDayForecast
+            ))
         return forecasts
 
     def _get_hourly_data_for_day(self, data: Dict, day_index: int) -> List[Dict]:
         """Extract hourly data for a specific day"""
-        start_idx = day_index * 24
-        end_idx = start_idx + 24
-        
+        # Match on the date prefix rather than slicing day_index * 24 - with
+        # start_hour/end_hour the hourly arrays don't align to midnight
+        date_str = data['daily']['time'][day_index]
+
         hourly_data = []
-        for i in range(start_idx, end_idx):
+        for i, t in enumerate(data['hourly']['time']):
+            if not t.startswith(date_str):
+                continue
             hourly_data.append({
                 'time': data['hourly']['time'][i],
                 'temp_f': data['hourly']['temperature_2m'][i],
@@ -340,47 +604,52 @@ class WeatherService:
             logger.warning("No current weather data available for hourly forecast")
             return []
         
-        ny_tz = pytz.timezone('America/New_York')
-        now = datetime.now(ny_tz)
-        current_hour = now.hour
-        
+        view = self._hourly_view(self._current_data)
+        # Binary-search the parsed timestamps for the current hour instead
+        # of indexing by now.hour - the hourly arrays don't start at
+        # midnight once start_hour trims the request window
+        now_hour = datetime.now(NY_TZ).replace(
+            minute=0, second=0, microsecond=0, tzinfo=None)
+        start = bisect.bisect_left(view.parsed, now_hour)
+
         hourly_data = []
-        for i in range(current_hour, current_hour + hours):
-            if i >= len(self._current_data['hourly']['time']):
-                break
+        for i in range(start, min(start + hours, len(view.times))):
+            code = view.codes[i]
             hourly_data.append({
-                'time': self._current_data['hourly']['time'][i],
-                'temp_f': self._current_data['hourly']['temperature_2m'][i],
-                'chance_of_rain': self._current_data['hourly']['precipitation_probability'][i],
-                'wind_mph': self._current_data['hourly']['windspeed_10m'][i],
+                'time': view.times[i],
+                'temp_f': float(view.temps[i]),
+                'chance_of_rain': float(view.precip[i]),
+                'wind_mph': float(view.wind[i]),
                 'condition': {
-                    'text': self._get_condition_text(self._current_data['hourly']['weathercode'][i]),
-                    'code': self._map_condition_code(self._current_data['hourly']['weathercode'][i])
+                    'text': self._get_condition_text(code),
+                    'code': self._map_condition_code(code)
                 },
-                'is_day': self._current_data['hourly']['is_day'][i]
+                'is_day': view.is_day[i]
             })
-        
+
         return hourly_data
 
-    def get_next_commutes(self, include_today: bool = True) -> List[Dict]:
-        """Get the next commute period forecasts"""
+    def get_next_commutes(self, include_today: bool = True,
+                          limit: int | None = None) -> List[Dict]:
+        """Get the next commute period forecasts, optionally capped at limit"""
         if not self._current_data:
             logger.warning("No current weather data available for commute forecasts")
             return []
-        
+
         try:
             # If we have commute forecasts in the current data, use those
             if 'commute_forecasts' in self._current_data:
                 forecasts = self._current_data['commute_forecasts']
                 if not include_today:
                     # Filter out today's forecasts if not requested
-                    today = datetime.now(pytz.timezone('America/New_York')).strftime('%Y-%m-%d')
+                    today = datetime.now(NY_TZ).strftime('%Y-%m-%d')
                     forecasts = [f for f in forecasts if f['date'] != today]
-                return forecasts
-            
+                return forecasts[:limit] if limit is not None else forecasts
+
             # Otherwise, generate them from the current data
             logger.debug("Generating commute forecasts from current data")
-            return self._get_commute_forecasts(self._current_data)
+            forecasts = self._get_commute_forecasts(self._current_data)
+            return forecasts[:limit] if limit is not None else forecasts
             
         except Exception as e:
             logger.error(f"Error getting commute forecasts: {e}")